@@ -0,0 +1,183 @@
+"""Microsoft Graph JSON batching utilities for Outlook MCP Server"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from .connection import (
+    MAX_RETRIES, RETRY_STATUSES, get_access_token, graph_request, loads_json, logger, retry_delay, throttle,
+)
+
+# Graph accepts at most 20 sub-requests per $batch call
+MAX_BATCH_SIZE = 20
+
+# Graph checks every sub-request against Outlook's limit of 4 concurrent
+# requests per mailbox, so even one full envelope can draw 429s (resent by
+# submit_chunk). Keep envelope concurrency low: a second one in flight only
+# overlaps round-trips
+MAX_CONCURRENT_BATCHES = 2
+
+# Sub-request statuses Graph returns before doing any work, so resending is safe for any method.
+# Other methods are also resent on transient 5xx, matching graph_request's retries
+RESEND_STATUSES = frozenset({429, 503})
+
+
+class OutlookBatchClient:
+    @staticmethod
+    def build_sub_request(request_id: int, op: Dict[str, Any]) -> Dict[str, Any]:
+        """Helper method to convert a request spec into a $batch sub-request"""
+        sub_request = {
+            "id": str(request_id),
+            "method": op["method"],
+            "url": op["url"],
+        }
+
+        # Sub-requests with a body must declare its content type
+        if op.get("body") is not None:
+            sub_request["headers"] = {"Content-Type": "application/json"}
+            sub_request["body"] = op["body"]
+
+        return sub_request
+
+    @staticmethod
+    def parse_sub_response(sub_response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Helper method to convert a $batch sub-response into a result dict"""
+        if sub_response is None:
+            return {"result": None, "error": "No response returned for request"}
+
+        status = sub_response.get("status", 0)
+        body = sub_response.get("body")
+
+        if status >= 400:
+            # Failed sub-responses may carry a plain-text body or a string error
+            error = body.get("error") if isinstance(body, dict) else body
+            if isinstance(error, dict):
+                message = error.get("message", "")
+            else:
+                message = "" if error is None else str(error)
+            return {"result": None, "error": f"HTTP {status}: {message}"}
+
+        return {"result": body, "error": None}
+
+    @staticmethod
+    def should_resend(op: Dict[str, Any], sub_response: Optional[Dict[str, Any]]) -> bool:
+        """Helper method to check whether a sub-request failed in a way that is safe to resend"""
+        if sub_response is None:
+            return False
+        statuses = RESEND_STATUSES if op["method"].upper() == "POST" else RETRY_STATUSES
+        return sub_response.get("status") in statuses
+
+    @staticmethod
+    def sub_response_delay(sub_response: Dict[str, Any], attempt: int) -> float:
+        """Helper method to pick the backoff for a throttled sub-request"""
+        headers = sub_response.get("headers") or {}
+        retry_after = next(
+            (value for name, value in headers.items() if name.lower() == "retry-after"), ""
+        )
+        return retry_delay(str(retry_after), attempt)
+
+    @staticmethod
+    def post_batch(ops: List[Dict[str, Any]], access_token: str) -> Dict[str, Dict[str, Any]]:
+        """Send one $batch call and return its sub-responses keyed by request id"""
+        payload = {
+            "requests": [
+                OutlookBatchClient.build_sub_request(request_id, op)
+                for request_id, op in enumerate(ops)
+            ]
+        }
+
+        # Graph counts every sub-request against the mailbox limit; graph_request
+        # accounts for the envelope itself
+        throttle(len(ops) - 1)
+        response = graph_request("POST", "/$batch", access_token, json=payload)
+        response.raise_for_status()
+
+        # Sub-responses may come back in any order, so match them by id
+        return {
+            sub_response.get("id"): sub_response
+            for sub_response in loads_json(response).get("responses", [])
+        }
+
+    @staticmethod
+    def submit_chunk(chunk: List[Dict[str, Any]], access_token: str) -> List[Dict[str, Any]]:
+        """
+        Send one chunk of at most MAX_BATCH_SIZE request specs.
+
+        Sub-requests get no retries inside $batch, so throttled ones (and
+        transient 5xx for methods other than POST, as in graph_request) are
+        resent in a smaller $batch up to MAX_RETRIES times, after the
+        longest Retry-After among them.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(chunk)
+        pending = list(range(len(chunk)))
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                responses = OutlookBatchClient.post_batch([chunk[index] for index in pending], access_token)
+            except Exception as e:
+                # Other chunks and earlier rounds may already have been applied, so
+                # report the unsent ops individually instead of discarding every result
+                error = f"Batch request failed: {e}"
+                for index in pending:
+                    results[index] = {"result": None, "error": error}
+                break
+
+            throttled = []
+            delay = 0.0
+            for request_id, index in enumerate(pending):
+                sub_response = responses.get(str(request_id))
+                try:
+                    if attempt < MAX_RETRIES and OutlookBatchClient.should_resend(chunk[index], sub_response):
+                        delay = max(delay, OutlookBatchClient.sub_response_delay(sub_response, attempt))
+                        throttled.append(index)
+                        continue
+                    results[index] = OutlookBatchClient.parse_sub_response(sub_response)
+                except Exception as e:
+                    # A malformed sub-response only fails its own op
+                    results[index] = {"result": None, "error": f"Invalid batch response: {e}"}
+
+            if not throttled:
+                break
+            logger.warning(
+                "Graph throttled %d of %d batched requests, resending in %.1fs",
+                len(throttled), len(pending), delay,
+            )
+            time.sleep(delay)
+            pending = throttled
+
+        return results
+
+    @staticmethod
+    def submit(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Submit request specs through the Graph $batch endpoint.
+
+        Specs are split into chunks of MAX_BATCH_SIZE and the chunks are
+        sent concurrently over the shared session, so N operations cost
+        roughly one round-trip per MAX_CONCURRENT_BATCHES chunks.
+
+        Args:
+            ops: Request specs with "method", "url" (relative to /v1.0)
+                and an optional JSON "body"
+
+        Returns:
+            One {"result", "error"} dict per spec, in the order given
+        """
+        # Resolve the token once and share it across all chunks
+        access_token = get_access_token()
+        chunks = [
+            ops[start:start + MAX_BATCH_SIZE]
+            for start in range(0, len(ops), MAX_BATCH_SIZE)
+        ]
+
+        if len(chunks) <= 1:
+            return [
+                result
+                for chunk in chunks
+                for result in OutlookBatchClient.submit_chunk(chunk, access_token)
+            ]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BATCHES, len(chunks))) as executor:
+            chunk_results = executor.map(
+                lambda chunk: OutlookBatchClient.submit_chunk(chunk, access_token),
+                chunks,
+            )
+            return [result for results in chunk_results for result in results]
@@ -1,14 +1,143 @@
 """Connection utilities for Outlook MCP Server"""
+import base64
+import json
 import os
-from typing import Any
+import random
+import socket
+import threading
+import time
+import uuid
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import logging
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    orjson = None
+
 load_dotenv(override=True)
-logging.basicConfig(level=logging.INFO)
+
+# Optional settings documented in .env.example, read once at import
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+REQUEST_TIMEOUT = float(os.environ.get("REQUEST_TIMEOUT", "10"))
+REQUEST_CONNECT_TIMEOUT = float(os.environ.get("REQUEST_CONNECT_TIMEOUT", "3.05"))
+GRAPH_RATE_LIMIT = float(os.environ.get("GRAPH_RATE_LIMIT", "15"))
+GRAPH_RATE_BURST = float(os.environ.get("GRAPH_RATE_BURST", "100"))
+
+_log_level = logging.getLevelName(LOG_LEVEL)
+logging.basicConfig(level=_log_level if isinstance(_log_level, int) else logging.INFO)
 logger = logging.getLogger("outlook-mcp-server")
 
+GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
+# $top for list endpoints; Graph otherwise pages at 10 items for most collections
+LIST_PAGE_SIZE = 200
+
+# Seconds a pooled connection may sit idle before the kernel starts keepalive probes,
+# and seconds between unanswered probes
+TCP_KEEPIDLE = 30
+TCP_KEEPINTVL = 10
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets disable Nagle and send TCP keepalive probes"""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        # urllib3's defaults already set TCP_NODELAY; keep them and add keepalive
+        socket_options = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        if hasattr(socket, "TCP_KEEPIDLE"):  # Not available on macOS/Windows
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPIDLE))
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPINTVL))
+        kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Graph statuses worth retrying after a short wait
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# POST is not idempotent, so only retry statuses Graph returns before doing any work
+POST_RETRY_STATUSES = frozenset({429, 503})
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+# Extra seconds added on top of Retry-After so throttled threads don't retry in lockstep
+RETRY_AFTER_JITTER = 0.25
+
+# Status retries live in graph_request(); the adapter only retries failed
+# connects, where nothing reached the server and any method is safe to resend
+CONNECT_RETRY = Retry(
+    total=MAX_RETRIES,
+    connect=MAX_RETRIES,
+    read=0,
+    status=0,
+    other=0,
+    backoff_factor=RETRY_BASE_DELAY / 2,
+    raise_on_status=False,
+)
+
+# Shared session so repeated Graph and Nango calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", _KeepAliveAdapter(pool_connections=10, pool_maxsize=50, max_retries=CONNECT_RETRY))
+# Self-hosted Nango may be served over plain HTTP; pool those connections the same way
+SESSION.mount("http://", _KeepAliveAdapter(pool_connections=2, pool_maxsize=10, max_retries=CONNECT_RETRY))
+# Static headers live on the session; requests only add Authorization per call
+SESSION.headers.update({"Content-Type": "application/json"})
+
+
+class _RateLimiter:
+    """Token bucket that paces Graph requests below the per-mailbox throttle"""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cost: float = 1) -> None:
+        """Take cost tokens, sleeping until the bucket has refilled enough"""
+        if self.rate <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve now and sleep outside the lock, so waiters queue in order
+            self.tokens -= cost
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+# (connect, read): a dead endpoint fails fast instead of eating the whole read budget
+HTTP_TIMEOUT = (REQUEST_CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+
+# Graph allows 10,000 requests per 10 minutes per mailbox (~16/s); stay just under it
+_RATE_LIMITER = _RateLimiter(GRAPH_RATE_LIMIT, GRAPH_RATE_BURST)
+
+# Refresh cached tokens this many seconds before Nango says they expire
+EXPIRY_BUFFER = 60
+# Token lifetime to assume when Nango does not report an expiry
+DEFAULT_TOKEN_LIFETIME = 55 * 60
+
+# Access tokens keyed by (connection ID, integration ID): (token, expires_at epoch seconds)
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float]] = {}
+# Tool calls and $batch chunks run on worker threads; refresh one at a time
+_TOKEN_LOCK = threading.Lock()
+
+
+class NangoCredentialsError(ValueError):
+    """Raised when Nango configuration or credentials are missing or malformed"""
+
 
 def get_connection_credentials() -> dict[str, Any]:
     """Get credentials from Nango"""
@@ -16,8 +145,19 @@ def get_connection_credentials() -> dict[str, Any]:
     integration_id = os.environ.get("NANGO_INTEGRATION_ID")
     base_url = os.environ.get("NANGO_BASE_URL")
     secret_key = os.environ.get("NANGO_SECRET_KEY")
-    
-    
+
+    missing = [
+        name for name, value in (
+            ("NANGO_CONNECTION_ID", connection_id),
+            ("NANGO_INTEGRATION_ID", integration_id),
+            ("NANGO_BASE_URL", base_url),
+            ("NANGO_SECRET_KEY", secret_key),
+        )
+        if not value
+    ]
+    if missing:
+        raise NangoCredentialsError(f"Missing environment variables: {', '.join(missing)}")
+
     url = f"{base_url}/connection/{connection_id}"
     params = {
         "provider_config_key": integration_id,
@@ -25,16 +165,212 @@ def get_connection_credentials() -> dict[str, Any]:
     }
     headers = {"Authorization": f"Bearer {secret_key}"}
 
-    response = requests.get(url, headers=headers, params=params)
+    response = SESSION.get(url, headers=headers, params=params, timeout=HTTP_TIMEOUT)
     response.raise_for_status()  # Raise exception for bad status codes
     
-    return response.json()
+    return loads_json(response)
+
+
+def _jwt_expiry(access_token: str) -> Optional[float]:
+    """The exp claim of a JWT access token, or None for opaque tokens"""
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _token_expiry(credentials: Dict[str, Any]) -> float:
+    """Epoch seconds at which Nango's token expires, from expires_at, expires_in or the JWT itself"""
+    expires_at = credentials.get("expires_at")
+    if not expires_at:
+        expires_in = (credentials.get("raw") or {}).get("expires_in")
+        try:
+            return time.time() + float(expires_in)
+        except (TypeError, ValueError):
+            return _jwt_expiry(credentials.get("access_token") or "") or time.time() + DEFAULT_TOKEN_LIFETIME
+    try:
+        return datetime.fromisoformat(expires_at.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return time.time() + DEFAULT_TOKEN_LIFETIME
+
+
+def _token_cache_key() -> Tuple[str, str]:
+    """Cache key for the configured Nango connection and integration"""
+    return (
+        os.environ.get("NANGO_CONNECTION_ID", ""),
+        os.environ.get("NANGO_INTEGRATION_ID", ""),
+    )
 
 
 def get_access_token() -> str:
-    """Get access token from Nango credentials"""
-    credentials = get_connection_credentials()
-    access_token = credentials.get("credentials", {}).get("access_token")
-    if not access_token:
-        raise ValueError("Access token not found in credentials")
-    return access_token
+    """Get access token from Nango credentials, reusing it until it nears expiry"""
+    cache_key = _token_cache_key()
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached and time.time() < cached[1] - EXPIRY_BUFFER:
+        return cached[0]
+
+    with _TOKEN_LOCK:
+        # Another thread may have refreshed the token while we waited
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached and time.time() < cached[1] - EXPIRY_BUFFER:
+            return cached[0]
+
+        credentials = get_connection_credentials().get("credentials")
+        if not isinstance(credentials, dict):
+            raise NangoCredentialsError("Nango response did not include a credentials object")
+
+        access_token = credentials.get("access_token")
+        if not access_token:
+            raise NangoCredentialsError("Access token not found in credentials")
+
+        _TOKEN_CACHE[cache_key] = (access_token, _token_expiry(credentials))
+        return access_token
+
+
+def invalidate_access_token(access_token: Optional[str] = None) -> None:
+    """
+    Drop the cached access token so the next call fetches a fresh one.
+
+    When access_token is given, the cache is only cleared if it still holds
+    that token, so threads rejected with the same stale token don't discard
+    a replacement another thread has already fetched.
+    """
+    cache_key = _token_cache_key()
+    with _TOKEN_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached and (access_token is None or cached[0] == access_token):
+            del _TOKEN_CACHE[cache_key]
+
+
+def dumps_json(payload: Any) -> bytes:
+    """Serialize a request payload to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    # Match orjson: compact, with non-ASCII text as raw UTF-8 instead of \uXXXX escapes
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_json(response: requests.Response) -> Any:
+    """Parse a response body as JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def retry_delay(retry_after: str, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring a Retry-After value from Graph"""
+    if retry_after.isdigit():
+        return min(RETRY_MAX_DELAY, float(retry_after)) + random.uniform(0, RETRY_AFTER_JITTER)
+    if retry_after:
+        # Retry-After may also be an HTTP-date
+        try:
+            wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            return min(RETRY_MAX_DELAY, max(0.0, wait)) + random.uniform(0, RETRY_AFTER_JITTER)
+        except (TypeError, ValueError):
+            pass
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+    return delay * (1 + random.uniform(0, RETRY_JITTER))
+
+
+def throttle(cost: float = 1) -> None:
+    """Wait until cost more Graph requests fit under GRAPH_RATE_LIMIT (0 disables pacing)"""
+    _RATE_LIMITER.acquire(cost)
+
+
+def graph_request(method: str, path: str, access_token: str, **kwargs: Any) -> requests.Response:
+    """
+    Send a request to Microsoft Graph over the shared session.
+
+    Throttled (429) and transient 5xx responses are retried up to
+    MAX_RETRIES times with exponential backoff and jitter. A 401 drops the
+    cached token and resends once with a fresh one. The final response is
+    returned either way, so callers still decide how to handle errors via
+    raise_for_status().
+
+    path is relative to GRAPH_BASE_URL, or an absolute Graph URL such as
+    an @odata.nextLink.
+    """
+    headers = {"Authorization": f"Bearer {access_token}", **kwargs.pop("headers", {})}
+    retry_statuses = RETRY_STATUSES
+    if method.upper() == "POST":
+        retry_statuses = POST_RETRY_STATUSES
+        # Tag every attempt of the same POST with one ID so they can be correlated
+        headers.setdefault("client-request-id", str(uuid.uuid4()))
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    # Encode once up front so retries resend the same bytes
+    if "json" in kwargs:
+        kwargs["data"] = dumps_json(kwargs.pop("json"))
+
+    url = path if path.startswith("https://") else f"{GRAPH_BASE_URL}{path}"
+
+    for attempt in range(MAX_RETRIES + 1):
+        throttle()
+        response = SESSION.request(method, url, headers=headers, **kwargs)
+        if response.status_code not in retry_statuses or attempt == MAX_RETRIES:
+            break
+        delay = retry_delay(response.headers.get("Retry-After", ""), attempt)
+        logger.warning(
+            "Graph returned %s for %s %s, retrying in %.1fs",
+            response.status_code, method, path, delay,
+        )
+        time.sleep(delay)
+
+    # A rejected token is stale even if it has not reached expires_at yet.
+    # Graph rejects it before doing any work, so resending is safe for any method
+    if response.status_code == 401:
+        invalidate_access_token(access_token)
+        headers["Authorization"] = f"Bearer {get_access_token()}"
+        response = SESSION.request(method, url, headers=headers, **kwargs)
+
+    return response
+
+
+def upload_in_chunks(upload_url: str, content: bytes, chunk_size: int) -> requests.Response:
+    """
+    PUT content to a Graph upload session in Content-Range chunks.
+
+    Upload URLs are pre-authenticated, so no Authorization header is sent.
+    Returns the response to the final chunk.
+    """
+    total = len(content)
+    view = memoryview(content)
+    response = None
+    for start in range(0, total, chunk_size):
+        chunk = view[start:start + chunk_size]
+        end = start + len(chunk) - 1
+        response = SESSION.put(
+            upload_url,
+            data=chunk.tobytes(),
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Range": f"bytes {start}-{end}/{total}",
+            },
+            timeout=HTTP_TIMEOUT,
+        )
+        response.raise_for_status()
+    return response
+
+
+def iter_graph_collection(path: str, access_token: str, **kwargs: Any) -> Iterator[Any]:
+    """
+    Yield the items of a Graph collection, following @odata.nextLink.
+
+    Pages are fetched lazily, so a caller that stops early never requests
+    the remaining pages and only one page is held in memory at a time.
+    """
+    while path:
+        response = graph_request("GET", path, access_token, **kwargs)
+        response.raise_for_status()
+
+        page = loads_json(response)
+        yield from page.get("value", [])
+        path = page.get("@odata.nextLink")
+        # nextLink already carries the original query options
+        kwargs.pop("params", None)
+
+
+def graph_get_all(path: str, access_token: str, **kwargs: Any) -> List[Any]:
+    """GET a Graph collection, following @odata.nextLink until every page is read"""
+    return list(iter_graph_collection(path, access_token, **kwargs))
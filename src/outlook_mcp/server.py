@@ -6,9 +6,20 @@ It implements the MCP stdio transport protocol for seamless integration with MCP
 """
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
 import sys
+import time
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    uvloop = None
 
 from mcp.server.stdio import stdio_server
 from mcp.server import Server
@@ -19,20 +30,187 @@ from mcp.types import (
 
 # Import tool functions
 from outlook_mcp.tools.email import (
-    send_email, create_draft_email, send_draft_email, get_draft_emails,
-    delete_draft_email, update_draft_email,
+    send_email, send_many_emails, create_draft_email, send_draft_email, get_draft_emails,
+    delete_draft_email, update_draft_email, delete_many_draft_emails,
 )
 from outlook_mcp.tools.contacts import (
     create_contact, get_all_contacts, get_contact_details, update_contact, delete_contact,
+    create_many_contacts, delete_many_contacts, get_many_contacts,
 )
 from outlook_mcp.tools.calendar import (
     get_all_calendars, get_calendar_details, create_calendar, update_calendar,
     delete_calendar, get_all_events, get_event_details, create_event, delete_event,
+    create_many_calendars, delete_many_calendars, create_many_events, delete_many_events,
+    get_many_events, get_events_in_ranges,
 )
 from outlook_mcp.tools.folders import (
     get_all_folders, get_folder_details, create_folder, update_folder,
-    delete_folder, get_many_folders,
+    delete_folder, get_many_folders, create_many_folders, delete_many_folders,
 )
+from outlook_mcp.tools.overview import get_outlook_overview
+from outlook_mcp.tools.graph import batch_graph
+from outlook_mcp.connection import dumps_json, get_access_token, logger
+
+# Tool name -> implementation, looked up once per call_tool request
+_TOOL_DISPATCH = {
+    "send_email": send_email,
+    "send_many_emails": send_many_emails,
+    "create_draft_email": create_draft_email,
+    "send_draft_email": send_draft_email,
+    "get_draft_emails": get_draft_emails,
+    "update_draft_email": update_draft_email,
+    "delete_draft_email": delete_draft_email,
+    "delete_many_draft_emails": delete_many_draft_emails,
+    "create_contact": create_contact,
+    "get_all_contacts": get_all_contacts,
+    "get_contact_details": get_contact_details,
+    "update_contact": update_contact,
+    "delete_contact": delete_contact,
+    "create_many_contacts": create_many_contacts,
+    "delete_many_contacts": delete_many_contacts,
+    "get_many_contacts": get_many_contacts,
+    "get_all_calendars": get_all_calendars,
+    "get_calendar_details": get_calendar_details,
+    "create_calendar": create_calendar,
+    "update_calendar": update_calendar,
+    "delete_calendar": delete_calendar,
+    "create_many_calendars": create_many_calendars,
+    "delete_many_calendars": delete_many_calendars,
+    "get_all_events": get_all_events,
+    "get_event_details": get_event_details,
+    "create_event": create_event,
+    "delete_event": delete_event,
+    "create_many_events": create_many_events,
+    "delete_many_events": delete_many_events,
+    "get_many_events": get_many_events,
+    "get_events_in_ranges": get_events_in_ranges,
+    "get_all_folders": get_all_folders,
+    "get_folder_details": get_folder_details,
+    "create_folder": create_folder,
+    "update_folder": update_folder,
+    "delete_folder": delete_folder,
+    "get_many_folders": get_many_folders,
+    "create_many_folders": create_many_folders,
+    "delete_many_folders": delete_many_folders,
+    "get_outlook_overview": get_outlook_overview,
+    "batch_graph": batch_graph,
+}
+
+
+# Schema fragments shared by several tools; Tool schemas are built once and never mutated
+_STRING = {"type": "string"}
+_CONTACT_FIELD_PROPERTIES = {
+    field: _STRING
+    for field in (
+        "given_name", "surname", "email_addresses", "business_phones", "mobile_phone",
+        "job_title", "company_name", "department", "office_location",
+    )
+}
+_SEND_EMAIL_PROPERTIES = {
+    "subject": {"type": "string", "description": "Email subject line"},
+    "content": {"type": "string", "description": "Email body content (HTML or plain text)"},
+    "to_recipients": {"type": "array", "items": _STRING, "description": "List of TO recipient email addresses"},
+    "cc_recipients": {"type": "array", "items": _STRING, "description": "List of CC recipient email addresses (optional)"},
+    "bcc_recipients": {"type": "array", "items": _STRING, "description": "List of BCC recipient email addresses (optional)"},
+    "content_type": {"type": "string", "enum": ["HTML", "Text"], "default": "HTML", "description": "Content type of email body"},
+    "save_to_sent": {"type": "boolean", "default": True, "description": "Whether to save email to sent items (must be true when attachments total 3 MB or more)"},
+    "importance": {"type": "string", "enum": ["low", "normal", "high"], "default": "normal", "description": "Email importance level"},
+}
+_SEND_EMAIL_REQUIRED = ["subject", "content", "to_recipients"]
+_RETURN_BODY_PROPERTY = {
+    "type": "boolean",
+    "default": True,
+    "description": "Return the created object; set to false to return only the status code",
+}
+_OPTIONAL_CALENDAR_ID_PROPERTY = {
+    "type": "string",
+    "description": "Calendar ID (optional, uses default calendar if not specified)",
+}
+
+
+# Larger argument payloads (attachments, long recipient lists) are not echoed back in errors
+MAX_ERROR_ARGUMENTS_SIZE = 2048
+
+
+def _error_arguments(arguments: Dict[str, Any]) -> Any:
+    """Echo tool arguments in an error result, reducing large ones to their keys"""
+    if len(dumps_json(arguments)) <= MAX_ERROR_ARGUMENTS_SIZE:
+        return arguments
+    return {"_truncated": True, "keys": list(arguments)}
+
+
+def _dumps_text(result: Any) -> str:
+    """Serialize a tool result as indented JSON text, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(result, indent=2, default=str)
+
+
+# Read-only tools whose results can be reused for TOOL_CACHE_TTL seconds; any other tool
+# may change mailbox data, so calling one drops every cached result
+_CACHEABLE_TOOLS = frozenset({
+    "get_draft_emails",
+    "get_all_contacts", "get_contact_details", "get_many_contacts",
+    "get_all_calendars", "get_calendar_details",
+    "get_all_events", "get_event_details", "get_many_events", "get_events_in_ranges",
+    "get_all_folders", "get_folder_details", "get_many_folders",
+    "get_outlook_overview",
+})
+TOOL_CACHE_TTL = 60
+TOOL_CACHE_SIZE = 1024
+
+
+class _ToolResultCache:
+    """Short-lived cache of successful read-only tool results"""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries: Dict[str, Tuple[float, Any]] = {}
+        # Bumped by every write so reads that overlapped it are not stored
+        self.generation = 0
+        # Identical reads still waiting on Graph, shared by concurrent callers
+        self.inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    @staticmethod
+    def key(name: str, arguments: Dict[str, Any]) -> str:
+        """Build the cache key for a tool call"""
+        return f"{name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached result, or None when missing or expired"""
+        entry = self.entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    @staticmethod
+    def succeeded(result: Any) -> bool:
+        """Whether a result has no error, including per-item and per-section ones"""
+        if not isinstance(result, dict) or result.get("error") is not None:
+            return False
+        # Bulk tools report failed items (and the overview failed sections) inline
+        items = result.get("result")
+        if isinstance(items, dict):
+            items = items.values()
+        elif not isinstance(items, list):
+            return True
+        return not any(isinstance(item, dict) and item.get("error") is not None for item in items)
+
+    def put(self, key: str, result: Any, generation: int) -> None:
+        """Store a result if it fully succeeded and no write ran while it was fetched"""
+        if generation != self.generation or not self.succeeded(result):
+            return
+        self.entries.pop(key, None)
+        if len(self.entries) >= self.maxsize:
+            # Evict the oldest entry
+            self.entries.pop(next(iter(self.entries)))
+        self.entries[key] = (time.monotonic() + self.ttl, result)
+
+    def invalidate(self) -> None:
+        """Drop every cached result after a tool that may have changed data"""
+        self.generation += 1
+        self.entries.clear()
 
 
 class OutlookMCPServer:
@@ -41,414 +219,645 @@ class OutlookMCPServer:
     def __init__(self):
         """Initialize the Outlook MCP server with all tools."""
         self.server = Server("outlook-mcp")
+        # Tool schemas never change, so build them once rather than per tools/list request
+        self._tools = self._build_tools()
+        self._cache = _ToolResultCache(TOOL_CACHE_TTL, TOOL_CACHE_SIZE)
+        # Token prefetch started by run()
+        self._prefetch_task: Optional["asyncio.Task[None]"] = None
         self._setup_tools()
     
+    @staticmethod
+    def _build_tools() -> List[Tool]:
+        """Build the schemas for all available tools."""
+        return [
+            # Email tools
+            Tool(
+                name="send_email",
+                description="Send an email via Outlook with support for TO/CC/BCC recipients, HTML/text content, attachments, and importance levels",
+                inputSchema={
+                    "type": "object",
+                    "properties": _SEND_EMAIL_PROPERTIES,
+                    "required": _SEND_EMAIL_REQUIRED
+                }
+            ),
+            Tool(
+                name="send_many_emails",
+                description="Send multiple emails in batched Graph requests, reporting the outcome of each",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "emails": {
+                            "type": "array",
+                            "description": "Emails to send",
+                            "items": {
+                                "type": "object",
+                                "properties": _SEND_EMAIL_PROPERTIES,
+                                "required": _SEND_EMAIL_REQUIRED
+                            }
+                        }
+                    },
+                    "required": ["emails"]
+                }
+            ),
+            Tool(
+                name="create_draft_email",
+                description="Create a draft email that can be edited and sent later",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "subject": {"type": "string", "description": "Email subject line"},
+                        "content": {"type": "string", "description": "Email body content"},
+                        "to_recipients": {"type": "array", "items": _STRING, "description": "List of TO recipients"},
+                        "cc_recipients": {"type": "array", "items": _STRING, "description": "List of CC recipients (optional)"},
+                        "bcc_recipients": {"type": "array", "items": _STRING, "description": "List of BCC recipients (optional)"},
+                        "content_type": {"type": "string", "enum": ["HTML", "Text"], "default": "HTML"},
+                        "importance": {"type": "string", "enum": ["low", "normal", "high"], "default": "normal"}
+                    },
+                    "required": ["subject", "content", "to_recipients"]
+                }
+            ),
+            Tool(
+                name="send_draft_email",
+                description="Send an existing draft email",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "draft_id": {"type": "string", "description": "ID of the draft email to send"}
+                    },
+                    "required": ["draft_id"]
+                }
+            ),
+            Tool(
+                name="get_draft_emails",
+                description="Retrieve all draft emails from the drafts folder",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
+            ),
+            Tool(
+                name="update_draft_email",
+                description="Update an existing draft email",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "draft_id": {"type": "string", "description": "ID of the draft email to update"},
+                        "subject": {"type": "string", "description": "Updated subject line"},
+                        "content": {"type": "string", "description": "Updated content"},
+                        "to_recipients": {"type": "array", "items": _STRING},
+                        "cc_recipients": {"type": "array", "items": _STRING},
+                        "bcc_recipients": {"type": "array", "items": _STRING},
+                        "content_type": {"type": "string", "enum": ["HTML", "Text"]},
+                        "importance": {"type": "string", "enum": ["low", "normal", "high"]}
+                    },
+                    "required": ["draft_id"]
+                }
+            ),
+            Tool(
+                name="delete_draft_email",
+                description="Delete a draft email",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "draft_id": {"type": "string", "description": "ID of the draft email to delete"}
+                    },
+                    "required": ["draft_id"]
+                }
+            ),
+            Tool(
+                name="delete_many_draft_emails",
+                description="Delete multiple draft emails in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "draft_ids": {"type": "array", "items": _STRING, "description": "List of draft email IDs to delete"}
+                    },
+                    "required": ["draft_ids"]
+                }
+            ),
+            
+            # Contact Tools
+            Tool(
+                name="create_contact",
+                description="Create a new contact in Outlook with personal and business information",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "given_name": {"type": "string", "description": "First name of the contact"},
+                        "surname": {"type": "string", "description": "Last name of the contact"},
+                        "email_addresses": {"type": "string", "description": "Comma-separated email addresses"},
+                        "business_phones": {"type": "string", "description": "Business phone numbers"},
+                        "mobile_phone": {"type": "string", "description": "Mobile phone number"},
+                        "job_title": {"type": "string", "description": "Job title"},
+                        "company_name": {"type": "string", "description": "Company name"},
+                        "department": {"type": "string", "description": "Department"},
+                        "office_location": {"type": "string", "description": "Office location"},
+                        "return_body": _RETURN_BODY_PROPERTY
+                    },
+                    "required": ["given_name"]
+                }
+            ),
+            Tool(
+                name="get_all_contacts",
+                description="Retrieve all contacts from Outlook",
+                inputSchema={"type": "object", "properties": {}}
+            ),
+            Tool(
+                name="get_contact_details",
+                description="Get detailed information about a specific contact",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "contact_id": {"type": "string", "description": "Unique identifier of the contact"}
+                    },
+                    "required": ["contact_id"]
+                }
+            ),
+            Tool(
+                name="update_contact",
+                description="Update an existing contact's information",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "contact_id": {"type": "string", "description": "Unique identifier of the contact"},
+                        **_CONTACT_FIELD_PROPERTIES
+                    },
+                    "required": ["contact_id"]
+                }
+            ),
+            Tool(
+                name="delete_contact",
+                description="Delete a contact from Outlook",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "contact_id": {"type": "string", "description": "Unique identifier of the contact to delete"}
+                    },
+                    "required": ["contact_id"]
+                }
+            ),
+            Tool(
+                name="create_many_contacts",
+                description="Create multiple contacts in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "contacts": {
+                            "type": "array",
+                            "description": "List of contacts to create",
+                            "items": {
+                                "type": "object",
+                                "properties": _CONTACT_FIELD_PROPERTIES,
+                                "required": ["given_name"]
+                            }
+                        }
+                    },
+                    "required": ["contacts"]
+                }
+            ),
+            Tool(
+                name="delete_many_contacts",
+                description="Delete multiple contacts in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "contact_ids": {"type": "array", "items": _STRING, "description": "List of contact IDs to delete"}
+                    },
+                    "required": ["contact_ids"]
+                }
+            ),
+            Tool(
+                name="get_many_contacts",
+                description="Get detailed information for multiple contacts in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "contact_ids": {"type": "array", "items": _STRING, "description": "List of contact IDs to retrieve"}
+                    },
+                    "required": ["contact_ids"]
+                }
+            ),
+            
+            # Calendar Tools
+            Tool(
+                name="get_all_calendars",
+                description="Retrieve all calendars from Outlook",
+                inputSchema={"type": "object", "properties": {}}
+            ),
+            Tool(
+                name="get_calendar_details",
+                description="Get detailed information about a specific calendar",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calendar_id": {"type": "string", "description": "Unique identifier of the calendar"},
+                        "fields": {"type": "array", "items": _STRING, "description": "Graph properties to return (optional, returns all if not specified)"}
+                    },
+                    "required": ["calendar_id"]
+                }
+            ),
+            Tool(
+                name="create_calendar",
+                description="Create a new calendar with specified name and color",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Name of the new calendar"},
+                        "color": {"type": "string", "description": "Calendar color theme", "default": "auto"},
+                        "return_body": _RETURN_BODY_PROPERTY
+                    },
+                    "required": ["name"]
+                }
+            ),
+            Tool(
+                name="update_calendar",
+                description="Update an existing calendar's properties",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calendar_id": {"type": "string", "description": "Unique identifier of the calendar"},
+                        "name": {"type": "string", "description": "Updated calendar name"},
+                        "color": {"type": "string", "description": "Updated calendar color"}
+                    },
+                    "required": ["calendar_id"]
+                }
+            ),
+            Tool(
+                name="delete_calendar",
+                description="Delete a calendar from Outlook",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calendar_id": {"type": "string", "description": "Unique identifier of the calendar to delete"}
+                    },
+                    "required": ["calendar_id"]
+                }
+            ),
+            Tool(
+                name="create_many_calendars",
+                description="Create multiple calendars in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calendars": {
+                            "type": "array",
+                            "description": "List of calendars to create",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string", "description": "Name of the new calendar"},
+                                    "color": {"type": "string", "description": "Calendar color theme", "default": "auto"}
+                                },
+                                "required": ["name"]
+                            }
+                        }
+                    },
+                    "required": ["calendars"]
+                }
+            ),
+            Tool(
+                name="delete_many_calendars",
+                description="Delete multiple calendars in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calendar_ids": {"type": "array", "items": _STRING, "description": "List of calendar IDs to delete"}
+                    },
+                    "required": ["calendar_ids"]
+                }
+            ),
+            Tool(
+                name="get_all_events",
+                description="Retrieve all events from a calendar or the default calendar",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calendar_id": _OPTIONAL_CALENDAR_ID_PROPERTY
+                    }
+                }
+            ),
+            Tool(
+                name="get_event_details",
+                description="Get detailed information about a specific event",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "event_id": {"type": "string", "description": "Unique identifier of the event"},
+                        "fields": {"type": "array", "items": _STRING, "description": "Graph properties to return (optional, returns the common event fields if not specified)"}
+                    },
+                    "required": ["event_id"]
+                }
+            ),
+            Tool(
+                name="create_event",
+                description="Create a new calendar event with attendees and location",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "subject": {"type": "string", "description": "Event title/subject"},
+                        "start_datetime": {"type": "string", "description": "Start date and time in ISO format (e.g., 2024-01-15T10:00:00)"},
+                        "end_datetime": {"type": "string", "description": "End date and time in ISO format"},
+                        "start_timezone": {"type": "string", "default": "UTC", "description": "Start timezone"},
+                        "end_timezone": {"type": "string", "default": "UTC", "description": "End timezone"},
+                        "body_content": {"type": "string", "description": "Event description/body"},
+                        "body_content_type": {"type": "string", "enum": ["HTML", "Text"], "default": "HTML"},
+                        "location": {"type": "string", "description": "Event location"},
+                        "attendees": {"type": "array", "items": _STRING, "description": "List of attendee email addresses"},
+                        "calendar_id": _OPTIONAL_CALENDAR_ID_PROPERTY,
+                        "return_body": _RETURN_BODY_PROPERTY
+                    },
+                    "required": ["subject", "start_datetime", "end_datetime"]
+                }
+            ),
+            Tool(
+                name="delete_event",
+                description="Delete an event from the calendar",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "event_id": {"type": "string", "description": "Unique identifier of the event to delete"}
+                    },
+                    "required": ["event_id"]
+                }
+            ),
+            Tool(
+                name="create_many_events",
+                description="Create multiple calendar events in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "events": {
+                            "type": "array",
+                            "description": "List of events to create",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "subject": _STRING,
+                                    "start_datetime": _STRING,
+                                    "end_datetime": _STRING,
+                                    "start_timezone": {"type": "string", "default": "UTC"},
+                                    "end_timezone": {"type": "string", "default": "UTC"},
+                                    "body_content": _STRING,
+                                    "body_content_type": {"type": "string", "enum": ["HTML", "Text"], "default": "HTML"},
+                                    "location": _STRING,
+                                    "attendees": {"type": "array", "items": _STRING},
+                                    "calendar_id": _STRING
+                                },
+                                "required": ["subject", "start_datetime", "end_datetime"]
+                            }
+                        }
+                    },
+                    "required": ["events"]
+                }
+            ),
+            Tool(
+                name="delete_many_events",
+                description="Delete multiple calendar events in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "event_ids": {"type": "array", "items": _STRING, "description": "List of event IDs to delete"}
+                    },
+                    "required": ["event_ids"]
+                }
+            ),
+            Tool(
+                name="get_many_events",
+                description="Get detailed information for multiple events in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "event_ids": {"type": "array", "items": _STRING, "description": "List of event IDs to retrieve"}
+                    },
+                    "required": ["event_ids"]
+                }
+            ),
+            Tool(
+                name="get_events_in_ranges",
+                description="Retrieve events for multiple calendar time ranges in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "ranges": {
+                            "type": "array",
+                            "description": "Time ranges to query",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "start_datetime": {"type": "string", "description": "Range start in ISO format"},
+                                    "end_datetime": {"type": "string", "description": "Range end in ISO format"},
+                                    "calendar_id": _OPTIONAL_CALENDAR_ID_PROPERTY
+                                },
+                                "required": ["start_datetime", "end_datetime"]
+                            }
+                        }
+                    },
+                    "required": ["ranges"]
+                }
+            ),
+            
+            # Folder Tools
+            Tool(
+                name="get_all_folders",
+                description="Retrieve all mail folders from Outlook",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "include_child_folders": {"type": "boolean", "default": False, "description": "Also return nested child folders; parents whose children could not be read are listed as {id, error} entries"},
+                        "max_depth": {"type": "integer", "minimum": 1, "description": "Levels of child folders to fetch (optional, fetches every level if not specified)"}
+                    }
+                }
+            ),
+            Tool(
+                name="get_folder_details",
+                description="Get detailed information about a specific mail folder",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "folder_id": {"type": "string", "description": "Unique identifier of the folder"}
+                    },
+                    "required": ["folder_id"]
+                }
+            ),
+            Tool(
+                name="create_folder",
+                description="Create a new mail folder, optionally nested under a parent folder",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "display_name": {"type": "string", "description": "Display name for the new folder"},
+                        "parent_folder_id": {"type": "string", "description": "Parent folder ID (optional, creates in root if not specified)"},
+                        "return_body": _RETURN_BODY_PROPERTY
+                    },
+                    "required": ["display_name"]
+                }
+            ),
+            Tool(
+                name="update_folder",
+                description="Update a folder's display name",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "folder_id": {"type": "string", "description": "Unique identifier of the folder"},
+                        "display_name": {"type": "string", "description": "New display name for the folder"}
+                    },
+                    "required": ["folder_id", "display_name"]
+                }
+            ),
+            Tool(
+                name="delete_folder",
+                description="Delete a mail folder from Outlook",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "folder_id": {"type": "string", "description": "Unique identifier of the folder to delete"}
+                    },
+                    "required": ["folder_id"]
+                }
+            ),
+            Tool(
+                name="get_many_folders",
+                description="Get detailed information for multiple folders in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "folder_ids": {"type": "array", "items": _STRING, "description": "List of folder IDs to retrieve"}
+                    },
+                    "required": ["folder_ids"]
+                }
+            ),
+            Tool(
+                name="create_many_folders",
+                description="Create multiple mail folders in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "display_names": {"type": "array", "items": _STRING, "description": "Display names for the new folders"},
+                        "parent_folder_id": {"type": "string", "description": "Parent folder ID (optional, creates in root if not specified)"}
+                    },
+                    "required": ["display_names"]
+                }
+            ),
+            Tool(
+                name="delete_many_folders",
+                description="Delete multiple mail folders in batched Graph requests",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "folder_ids": {"type": "array", "items": _STRING, "description": "List of folder IDs to delete"}
+                    },
+                    "required": ["folder_ids"]
+                }
+            ),
+            
+            # Overview Tools
+            Tool(
+                name="get_outlook_overview",
+                description="Retrieve all calendars, contacts, events, and mail folders in a single batched Graph request",
+                inputSchema={"type": "object", "properties": {}}
+            ),
+
+            # Graph Tools
+            Tool(
+                name="batch_graph",
+                description="Run multiple Microsoft Graph requests in batched $batch calls (20 per call)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "requests": {
+                            "type": "array",
+                            "description": "Graph requests to run",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "id": {"type": "string", "description": "Caller-chosen ID echoed back in the results (optional, defaults to the list index)"},
+                                    "method": {"type": "string", "default": "GET", "description": "HTTP method"},
+                                    "url": {"type": "string", "description": "Path relative to /v1.0, e.g. /me/contacts/{id}"},
+                                    "body": {"type": "object", "description": "JSON request body (optional)"}
+                                },
+                                "required": ["url"]
+                            }
+                        }
+                    },
+                    "required": ["requests"]
+                }
+            )
+        ]
+
     def _setup_tools(self):
         """Setup all available tools with their schemas."""
         
-        # Email Tools
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List all available tools."""
-            return [
-                # Email tools
-                Tool(
-                    name="send_email",
-                    description="Send an email via Outlook with support for TO/CC/BCC recipients, HTML/text content, attachments, and importance levels",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "subject": {"type": "string", "description": "Email subject line"},
-                            "content": {"type": "string", "description": "Email body content (HTML or plain text)"},
-                            "to_recipients": {"type": "array", "items": {"type": "string"}, "description": "List of TO recipient email addresses"},
-                            "cc_recipients": {"type": "array", "items": {"type": "string"}, "description": "List of CC recipient email addresses (optional)"},
-                            "bcc_recipients": {"type": "array", "items": {"type": "string"}, "description": "List of BCC recipient email addresses (optional)"},
-                            "content_type": {"type": "string", "enum": ["HTML", "Text"], "default": "HTML", "description": "Content type of email body"},
-                            "save_to_sent": {"type": "boolean", "default": True, "description": "Whether to save email to sent items"},
-                            "importance": {"type": "string", "enum": ["low", "normal", "high"], "default": "normal", "description": "Email importance level"}
-                        },
-                        "required": ["subject", "content", "to_recipients"]
-                    }
-                ),
-                Tool(
-                    name="create_draft_email",
-                    description="Create a draft email that can be edited and sent later",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "subject": {"type": "string", "description": "Email subject line"},
-                            "content": {"type": "string", "description": "Email body content"},
-                            "to_recipients": {"type": "array", "items": {"type": "string"}, "description": "List of TO recipients"},
-                            "cc_recipients": {"type": "array", "items": {"type": "string"}, "description": "List of CC recipients (optional)"},
-                            "bcc_recipients": {"type": "array", "items": {"type": "string"}, "description": "List of BCC recipients (optional)"},
-                            "content_type": {"type": "string", "enum": ["HTML", "Text"], "default": "HTML"},
-                            "importance": {"type": "string", "enum": ["low", "normal", "high"], "default": "normal"}
-                        },
-                        "required": ["subject", "content", "to_recipients"]
-                    }
-                ),
-                Tool(
-                    name="send_draft_email",
-                    description="Send an existing draft email",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "draft_id": {"type": "string", "description": "ID of the draft email to send"}
-                        },
-                        "required": ["draft_id"]
-                    }
-                ),
-                Tool(
-                    name="get_draft_emails",
-                    description="Retrieve all draft emails from the drafts folder",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="update_draft_email",
-                    description="Update an existing draft email",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "draft_id": {"type": "string", "description": "ID of the draft email to update"},
-                            "subject": {"type": "string", "description": "Updated subject line"},
-                            "content": {"type": "string", "description": "Updated content"},
-                            "to_recipients": {"type": "array", "items": {"type": "string"}},
-                            "cc_recipients": {"type": "array", "items": {"type": "string"}},
-                            "bcc_recipients": {"type": "array", "items": {"type": "string"}},
-                            "content_type": {"type": "string", "enum": ["HTML", "Text"]},
-                            "importance": {"type": "string", "enum": ["low", "normal", "high"]}
-                        },
-                        "required": ["draft_id"]
-                    }
-                ),
-                Tool(
-                    name="delete_draft_email",
-                    description="Delete a draft email",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "draft_id": {"type": "string", "description": "ID of the draft email to delete"}
-                        },
-                        "required": ["draft_id"]
-                    }
-                ),
-                
-                # Contact Tools
-                Tool(
-                    name="create_contact",
-                    description="Create a new contact in Outlook with personal and business information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "given_name": {"type": "string", "description": "First name of the contact"},
-                            "surname": {"type": "string", "description": "Last name of the contact"},
-                            "email_addresses": {"type": "string", "description": "Comma-separated email addresses"},
-                            "business_phones": {"type": "string", "description": "Business phone numbers"},
-                            "mobile_phone": {"type": "string", "description": "Mobile phone number"},
-                            "job_title": {"type": "string", "description": "Job title"},
-                            "company_name": {"type": "string", "description": "Company name"},
-                            "department": {"type": "string", "description": "Department"},
-                            "office_location": {"type": "string", "description": "Office location"}
-                        },
-                        "required": ["given_name"]
-                    }
-                ),
-                Tool(
-                    name="get_all_contacts",
-                    description="Retrieve all contacts from Outlook",
-                    inputSchema={"type": "object", "properties": {}}
-                ),
-                Tool(
-                    name="get_contact_details",
-                    description="Get detailed information about a specific contact",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "contact_id": {"type": "string", "description": "Unique identifier of the contact"}
-                        },
-                        "required": ["contact_id"]
-                    }
-                ),
-                Tool(
-                    name="update_contact",
-                    description="Update an existing contact's information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "contact_id": {"type": "string", "description": "Unique identifier of the contact"},
-                            "given_name": {"type": "string"},
-                            "surname": {"type": "string"},
-                            "email_addresses": {"type": "string"},
-                            "business_phones": {"type": "string"},
-                            "mobile_phone": {"type": "string"},
-                            "job_title": {"type": "string"},
-                            "company_name": {"type": "string"},
-                            "department": {"type": "string"},
-                            "office_location": {"type": "string"}
-                        },
-                        "required": ["contact_id"]
-                    }
-                ),
-                Tool(
-                    name="delete_contact",
-                    description="Delete a contact from Outlook",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "contact_id": {"type": "string", "description": "Unique identifier of the contact to delete"}
-                        },
-                        "required": ["contact_id"]
-                    }
-                ),
-                
-                # Calendar Tools
-                Tool(
-                    name="get_all_calendars",
-                    description="Retrieve all calendars from Outlook",
-                    inputSchema={"type": "object", "properties": {}}
-                ),
-                Tool(
-                    name="get_calendar_details",
-                    description="Get detailed information about a specific calendar",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "calendar_id": {"type": "string", "description": "Unique identifier of the calendar"}
-                        },
-                        "required": ["calendar_id"]
-                    }
-                ),
-                Tool(
-                    name="create_calendar",
-                    description="Create a new calendar with specified name and color",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string", "description": "Name of the new calendar"},
-                            "color": {"type": "string", "description": "Calendar color theme", "default": "auto"}
-                        },
-                        "required": ["name"]
-                    }
-                ),
-                Tool(
-                    name="update_calendar",
-                    description="Update an existing calendar's properties",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "calendar_id": {"type": "string", "description": "Unique identifier of the calendar"},
-                            "name": {"type": "string", "description": "Updated calendar name"},
-                            "color": {"type": "string", "description": "Updated calendar color"}
-                        },
-                        "required": ["calendar_id"]
-                    }
-                ),
-                Tool(
-                    name="delete_calendar",
-                    description="Delete a calendar from Outlook",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "calendar_id": {"type": "string", "description": "Unique identifier of the calendar to delete"}
-                        },
-                        "required": ["calendar_id"]
-                    }
-                ),
-                Tool(
-                    name="get_all_events",
-                    description="Retrieve all events from a calendar or the default calendar",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "calendar_id": {"type": "string", "description": "Calendar ID (optional, uses default calendar if not specified)"}
-                        }
-                    }
-                ),
-                Tool(
-                    name="get_event_details",
-                    description="Get detailed information about a specific event",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "event_id": {"type": "string", "description": "Unique identifier of the event"}
-                        },
-                        "required": ["event_id"]
-                    }
-                ),
-                Tool(
-                    name="create_event",
-                    description="Create a new calendar event with attendees and location",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "subject": {"type": "string", "description": "Event title/subject"},
-                            "start_datetime": {"type": "string", "description": "Start date and time in ISO format (e.g., 2024-01-15T10:00:00)"},
-                            "end_datetime": {"type": "string", "description": "End date and time in ISO format"},
-                            "start_timezone": {"type": "string", "default": "UTC", "description": "Start timezone"},
-                            "end_timezone": {"type": "string", "default": "UTC", "description": "End timezone"},
-                            "body_content": {"type": "string", "description": "Event description/body"},
-                            "body_content_type": {"type": "string", "enum": ["HTML", "Text"], "default": "HTML"},
-                            "location": {"type": "string", "description": "Event location"},
-                            "attendees": {"type": "array", "items": {"type": "string"}, "description": "List of attendee email addresses"},
-                            "calendar_id": {"type": "string", "description": "Calendar ID (optional, uses default calendar if not specified)"}
-                        },
-                        "required": ["subject", "start_datetime", "end_datetime"]
-                    }
-                ),
-                Tool(
-                    name="delete_event",
-                    description="Delete an event from the calendar",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "event_id": {"type": "string", "description": "Unique identifier of the event to delete"}
-                        },
-                        "required": ["event_id"]
-                    }
-                ),
-                
-                # Folder Tools
-                Tool(
-                    name="get_all_folders",
-                    description="Retrieve all mail folders from Outlook",
-                    inputSchema={"type": "object", "properties": {}}
-                ),
-                Tool(
-                    name="get_folder_details",
-                    description="Get detailed information about a specific mail folder",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "folder_id": {"type": "string", "description": "Unique identifier of the folder"}
-                        },
-                        "required": ["folder_id"]
-                    }
-                ),
-                Tool(
-                    name="create_folder",
-                    description="Create a new mail folder, optionally nested under a parent folder",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "display_name": {"type": "string", "description": "Display name for the new folder"},
-                            "parent_folder_id": {"type": "string", "description": "Parent folder ID (optional, creates in root if not specified)"}
-                        },
-                        "required": ["display_name"]
-                    }
-                ),
-                Tool(
-                    name="update_folder",
-                    description="Update a folder's display name",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "folder_id": {"type": "string", "description": "Unique identifier of the folder"},
-                            "display_name": {"type": "string", "description": "New display name for the folder"}
-                        },
-                        "required": ["folder_id", "display_name"]
-                    }
-                ),
-                Tool(
-                    name="delete_folder",
-                    description="Delete a mail folder from Outlook",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "folder_id": {"type": "string", "description": "Unique identifier of the folder to delete"}
-                        },
-                        "required": ["folder_id"]
-                    }
-                ),
-                Tool(
-                    name="get_many_folders",
-                    description="Get detailed information for multiple folders in a single request",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "folder_ids": {"type": "array", "items": {"type": "string"}, "description": "List of folder IDs to retrieve"}
-                        },
-                        "required": ["folder_ids"]
-                    }
-                )
-            ]
+            return self._tools
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Execute a tool with the given arguments."""
             try:
-                # Route the tool call to the appropriate function
-                if name == "send_email":
-                    result = send_email(**arguments)
-                elif name == "create_draft_email":
-                    result = create_draft_email(**arguments)
-                elif name == "send_draft_email":
-                    result = send_draft_email(**arguments)
-                elif name == "get_draft_emails":
-                    result = get_draft_emails(**arguments)
-                elif name == "update_draft_email":
-                    result = update_draft_email(**arguments)
-                elif name == "delete_draft_email":
-                    result = delete_draft_email(**arguments)
-                elif name == "create_contact":
-                    result = create_contact(**arguments)
-                elif name == "get_all_contacts":
-                    result = get_all_contacts(**arguments)
-                elif name == "get_contact_details":
-                    result = get_contact_details(**arguments)
-                elif name == "update_contact":
-                    result = update_contact(**arguments)
-                elif name == "delete_contact":
-                    result = delete_contact(**arguments)
-                elif name == "get_all_calendars":
-                    result = get_all_calendars(**arguments)
-                elif name == "get_calendar_details":
-                    result = get_calendar_details(**arguments)
-                elif name == "create_calendar":
-                    result = create_calendar(**arguments)
-                elif name == "update_calendar":
-                    result = update_calendar(**arguments)
-                elif name == "delete_calendar":
-                    result = delete_calendar(**arguments)
-                elif name == "get_all_events":
-                    result = get_all_events(**arguments)
-                elif name == "get_event_details":
-                    result = get_event_details(**arguments)
-                elif name == "create_event":
-                    result = create_event(**arguments)
-                elif name == "delete_event":
-                    result = delete_event(**arguments)
-                elif name == "get_all_folders":
-                    result = get_all_folders(**arguments)
-                elif name == "get_folder_details":
-                    result = get_folder_details(**arguments)
-                elif name == "create_folder":
-                    result = create_folder(**arguments)
-                elif name == "update_folder":
-                    result = update_folder(**arguments)
-                elif name == "delete_folder":
-                    result = delete_folder(**arguments)
-                elif name == "get_many_folders":
-                    result = get_many_folders(**arguments)
-                else:
+                tool_fn = _TOOL_DISPATCH.get(name)
+                if tool_fn is None:
                     raise ValueError(f"Unknown tool: {name}")
+
+                if name in _CACHEABLE_TOOLS:
+                    result = await self._call_cached(name, tool_fn, arguments)
+                else:
+                    # Tools make blocking Graph calls, so run them off the event
+                    # loop and let independent tool calls overlap their round-trips
+                    result = await asyncio.to_thread(tool_fn, **arguments)
+                    self._cache.invalidate()
                 
                 # Return the result as TextContent
-                return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+                return [TextContent(type="text", text=_dumps_text(result))]
                 
             except Exception as e:
                 # Return error information
                 error_result = {
                     "error": str(e),
                     "tool": name,
-                    "arguments": arguments
+                    "arguments": _error_arguments(arguments or {})
                 }
-                return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+                return [TextContent(type="text", text=_dumps_text(error_result))]
     
+    async def _call_cached(self, name: str, tool_fn: Any, arguments: Dict[str, Any]) -> Any:
+        """Run a read-only tool, reusing a cached result or an identical call already in flight."""
+        key = self._cache.key(name, arguments)
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        task = self._cache.inflight.get(key)
+        if task is None:
+            generation = self._cache.generation
+
+            async def fetch():
+                result = await asyncio.to_thread(tool_fn, **arguments)
+                self._cache.put(key, result, generation)
+                return result
+
+            task = asyncio.ensure_future(fetch())
+            self._cache.inflight[key] = task
+            task.add_done_callback(lambda _: self._cache.inflight.pop(key, None))
+
+        # Shield the shared call so one cancelled caller doesn't cancel the others
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _prefetch_token():
+        """Warm the access token cache so the first tool call skips the Nango round-trip."""
+        try:
+            get_access_token()
+        except Exception as e:
+            # Not fatal: the first tool call fetches the token and reports the error
+            logger.warning("Token prefetch failed: %s", e)
+
     async def run(self):
         """Run the MCP server using stdio transport."""
+        # Overlap the Nango call with the client's initialize handshake. Keep a
+        # reference: the event loop only holds tasks weakly, so an unreferenced
+        # task can be garbage-collected before it finishes.
+        self._prefetch_task = asyncio.create_task(asyncio.to_thread(self._prefetch_token))
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream, 
@@ -470,7 +879,7 @@ def main():
         print("  or")
         print("  outlook-mcp")
         print("")
-        print("This server provides 26 tools for managing:")
+        print("This server provides 41 tools for managing:")
         print("  • Emails (send, draft, update)")
         print("  • Contacts (create, read, update, delete)")
         print("  • Calendars and Events (full CRUD operations)")
@@ -482,7 +891,8 @@ def main():
     # Create and run the server
     server = OutlookMCPServer()
     try:
-        asyncio.run(server.run())
+        # uvloop's libuv loop cuts per-message overhead on the stdio transport
+        (uvloop.run if uvloop is not None else asyncio.run)(server.run())
     except KeyboardInterrupt:
         print("\\nServer shutting down...", file=sys.stderr)
     except Exception as e:
@@ -1,7 +1,150 @@
 """Calendar management tools for Outlook MCP Server"""
 from typing import Dict, Any, Optional, List
+from urllib.parse import urlencode
 import requests
-from ..connection import get_access_token
+from ..batch import OutlookBatchClient
+from ..connection import (
+    LIST_PAGE_SIZE, get_access_token, graph_get_all, graph_request, iter_graph_collection, loads_json,
+)
+
+def _build_attendees(attendees: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Build Graph attendee objects from plain email addresses"""
+    return [
+        {
+            "emailAddress": {"address": attendee},
+            "type": "required"
+        }
+        for attendee in attendees or ()
+    ]
+
+
+def _create_calendar_request(name: str, color: str = "auto") -> Dict[str, Any]:
+    """Build the request spec for creating a calendar"""
+    return {
+        "method": "POST",
+        "url": "/me/calendars",
+        "body": {
+            "name": name,
+            "color": color
+        }
+    }
+
+
+def _delete_calendar_request(calendar_id: str) -> Dict[str, Any]:
+    """Build the request spec for deleting a calendar"""
+    return {"method": "DELETE", "url": f"/me/calendars/{calendar_id}"}
+
+
+def _delete_event_request(event_id: str) -> Dict[str, Any]:
+    """Build the request spec for deleting an event"""
+    return {"method": "DELETE", "url": f"/me/events/{event_id}"}
+
+
+# $select lists matching the fields kept by _filter_calendar and _filter_event
+CALENDAR_SELECT = "id,name,owner"
+EVENT_SELECT = "id,subject,start,end,organizer,location,attendees"
+# Default projection for get_event_details; skips links, ETags and other noise
+EVENT_DETAIL_SELECT = (
+    "id,subject,body,start,end,isAllDay,location,organizer,attendees,"
+    "isOnlineMeeting,onlineMeeting,importance,sensitivity,showAs,categories,"
+    "recurrence,reminderMinutesBeforeStart,isReminderOn,responseStatus,"
+    "isCancelled,createdDateTime,lastModifiedDateTime,seriesMasterId,type"
+)
+
+
+def _calendar_view_request(
+    start_datetime: str,
+    end_datetime: str,
+    calendar_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the request spec for listing events that overlap a time range"""
+    if calendar_id:
+        path = f"/me/calendars/{calendar_id}/calendarView"
+    else:
+        path = "/me/calendarView"
+
+    query = urlencode(
+        {
+            "startDateTime": start_datetime,
+            "endDateTime": end_datetime,
+            "$select": EVENT_SELECT,
+            "$top": LIST_PAGE_SIZE,
+        },
+        safe="$,:",
+    )
+    return {"method": "GET", "url": f"{path}?{query}"}
+
+
+def _filter_calendar(calendar: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Graph calendar to id, name, and owner"""
+    return {
+        "id": calendar.get("id"),
+        "name": calendar.get("name"),
+        "owner": (calendar.get("owner") or {}).get("name"),
+    }
+
+
+def _filter_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Graph event to the fields returned by the event tools"""
+    # Graph may send null for these, so fall back with `or` rather than a .get default
+    organizer = (event.get("organizer") or {}).get("emailAddress") or {}
+    return {
+        "id": event.get("id"),
+        "subject": event.get("subject"),
+        "start": event.get("start"),
+        "end": event.get("end"),
+        "organizer": organizer.get("address"),
+        "location": (event.get("location") or {}).get("displayName"),
+        "attendees": [
+            (attendee.get("emailAddress") or {}).get("address")
+            for attendee in event.get("attendees") or ()
+        ]
+    }
+
+
+def _create_event_request(
+    subject: str,
+    start_datetime: str,
+    end_datetime: str,
+    start_timezone: str = "UTC",
+    end_timezone: str = "UTC",
+    body_content: str = "",
+    body_content_type: str = "HTML",
+    location: Optional[str] = None,
+    attendees: Optional[List[str]] = None,
+    calendar_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the request spec for creating an event"""
+    if calendar_id:
+        url = f"/me/calendars/{calendar_id}/events"
+    else:
+        url = "/me/events"
+
+    event_data = {
+        "subject": subject,
+        "start": {
+            "dateTime": start_datetime,
+            "timeZone": start_timezone
+        },
+        "end": {
+            "dateTime": end_datetime,
+            "timeZone": end_timezone
+        },
+        "body": {
+            "contentType": body_content_type,
+            "content": body_content
+        }
+    }
+
+    if location:
+        event_data["location"] = {"displayName": location}
+
+    # Leave attendees out entirely when none are given
+    processed_attendees = _build_attendees(attendees)
+    if processed_attendees:
+        event_data["attendees"] = processed_attendees
+
+    return {"method": "POST", "url": url, "body": event_data}
 
 
 def get_all_calendars() -> Dict[str, Any]:
@@ -10,24 +153,11 @@ def get_all_calendars() -> Dict[str, Any]:
     """
     try:
         access_token = get_access_token()
-        url = "https://graph.microsoft.com/v1.0/me/calendars"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = "/me/calendars"
+        params = {"$select": CALENDAR_SELECT, "$top": LIST_PAGE_SIZE}
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        calendars = response.json().get("value", [])
-        filtered_calendars = [
-            {
-                "id": calendar.get("id"),
-                "name": calendar.get("name"),
-                "owner": calendar.get("owner", {}).get("name"),
-            }
-            for calendar in calendars
-        ]
+        calendars = iter_graph_collection(path, access_token, params=params)
+        filtered_calendars = [_filter_calendar(calendar) for calendar in calendars]
 
         print(f"Fetched {len(filtered_calendars)} calendars.")
         return {"result": filtered_calendars, "error": None}
@@ -42,20 +172,20 @@ def get_all_calendars() -> Dict[str, Any]:
         return {"result": None, "error": error_message}
 
 
-def get_calendar_details(calendar_id: str) -> Dict[str, Any]:
-    """Get details of a specific calendar"""
+def get_calendar_details(
+    calendar_id: str,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Get details of a specific calendar, optionally limited to the given fields"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/calendars/{calendar_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/calendars/{calendar_id}"
+        params = {"$select": ",".join(fields)} if fields else None
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = graph_request("GET", path, access_token, params=params)
         response.raise_for_status()
 
-        calendar = response.json()
+        calendar = loads_json(response)
         print(f"Retrieved calendar details for: {calendar.get('name')}")
         return {"result": calendar, "error": None}
         
@@ -67,26 +197,22 @@ def get_calendar_details(calendar_id: str) -> Dict[str, Any]:
 
 def create_calendar(
     name: str,
-    color: str = "auto"
+    color: str = "auto",
+    return_body: bool = True
 ) -> Dict[str, Any]:
     """Create a new calendar"""
     try:
         access_token = get_access_token()
-        url = "https://graph.microsoft.com/v1.0/me/calendars"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
-        calendar_data = {
-            "name": name,
-            "color": color
-        }
-
-        response = requests.post(url, headers=headers, json=calendar_data, timeout=10)
+        spec = _create_calendar_request(name, color)
+        response = graph_request(spec["method"], spec["url"], access_token, json=spec["body"])
         response.raise_for_status()
 
-        calendar = response.json()
+        # Skip decoding the created calendar when the caller does not need it
+        if not return_body:
+            print(f"Created calendar: {name}")
+            return {"result": {"status_code": response.status_code}, "error": None}
+
+        calendar = loads_json(response)
         print(f"Created calendar: {calendar.get('name')}")
         return {"result": calendar, "error": None}
         
@@ -104,11 +230,7 @@ def update_calendar(
     """Update an existing calendar"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/calendars/{calendar_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/calendars/{calendar_id}"
 
         update_data = {}
         if name:
@@ -116,10 +238,10 @@ def update_calendar(
         if color:
             update_data["color"] = color
 
-        response = requests.patch(url, headers=headers, json=update_data, timeout=10)
+        response = graph_request("PATCH", path, access_token, json=update_data)
         response.raise_for_status()
 
-        updated_calendar = response.json()
+        updated_calendar = loads_json(response)
         print(f"Updated calendar: {calendar_id}")
         return {"result": updated_calendar, "error": None}
         
@@ -133,13 +255,8 @@ def delete_calendar(calendar_id: str) -> Dict[str, Any]:
     """Delete a calendar"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/calendars/{calendar_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.delete(url, headers=headers, timeout=10)
+        spec = _delete_calendar_request(calendar_id)
+        response = graph_request(spec["method"], spec["url"], access_token)
         response.raise_for_status()
 
         print(f"Deleted calendar: {calendar_id}")
@@ -157,34 +274,13 @@ def get_all_events(calendar_id: Optional[str] = None) -> Dict[str, Any]:
         access_token = get_access_token()
         
         if calendar_id:
-            url = f"https://graph.microsoft.com/v1.0/me/calendars/{calendar_id}/events"
+            path = f"/me/calendars/{calendar_id}/events"
         else:
-            url = "https://graph.microsoft.com/v1.0/me/events"
-            
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+            path = "/me/events"
+        params = {"$select": EVENT_SELECT, "$top": LIST_PAGE_SIZE}
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        events = response.json().get("value", [])
-        filtered_events = [
-            {
-                "id": event.get("id"),
-                "subject": event.get("subject"),
-                "start": event.get("start"),
-                "end": event.get("end"),
-                "organizer": event.get("organizer", {}).get("emailAddress", {}).get("address"),
-                "location": event.get("location", {}).get("displayName"),
-                "attendees": [
-                    attendee.get("emailAddress", {}).get("address")
-                    for attendee in event.get("attendees", [])
-                ]
-            }
-            for event in events
-        ]
+        events = iter_graph_collection(path, access_token, params=params)
+        filtered_events = [_filter_event(event) for event in events]
 
         print(f"Retrieved {len(filtered_events)} events")
         return {"result": filtered_events, "error": None}
@@ -195,20 +291,20 @@ def get_all_events(calendar_id: Optional[str] = None) -> Dict[str, Any]:
         return {"result": None, "error": error_message}
 
 
-def get_event_details(event_id: str) -> Dict[str, Any]:
-    """Get details of a specific event"""
+def get_event_details(
+    event_id: str,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Get details of a specific event, optionally limited to the given fields"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/events/{event_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/events/{event_id}"
+        params = {"$select": ",".join(fields) if fields else EVENT_DETAIL_SELECT}
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = graph_request("GET", path, access_token, params=params)
         response.raise_for_status()
 
-        event = response.json()
+        event = loads_json(response)
         print(f"Retrieved event details for: {event.get('subject')}")
         return {"result": event, "error": None}
         
@@ -228,54 +324,33 @@ def create_event(
     body_content_type: str = "HTML",
     location: Optional[str] = None,
     attendees: Optional[List[str]] = None,
-    calendar_id: Optional[str] = None
+    calendar_id: Optional[str] = None,
+    return_body: bool = True
 ) -> Dict[str, Any]:
     """Create a new event"""
     try:
         access_token = get_access_token()
-        
-        if calendar_id:
-            url = f"https://graph.microsoft.com/v1.0/me/calendars/{calendar_id}/events"
-        else:
-            url = "https://graph.microsoft.com/v1.0/me/events"
-            
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
-        event_data = {
-            "subject": subject,
-            "start": {
-                "dateTime": start_datetime,
-                "timeZone": start_timezone
-            },
-            "end": {
-                "dateTime": end_datetime,
-                "timeZone": end_timezone
-            },
-            "body": {
-                "contentType": body_content_type,
-                "content": body_content
-            }
-        }
-
-        if location:
-            event_data["location"] = {"displayName": location}
-
-        if attendees:
-            event_data["attendees"] = [
-                {
-                    "emailAddress": {"address": attendee},
-                    "type": "required"
-                }
-                for attendee in attendees
-            ]
-
-        response = requests.post(url, headers=headers, json=event_data, timeout=10)
+        spec = _create_event_request(
+            subject=subject,
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+            start_timezone=start_timezone,
+            end_timezone=end_timezone,
+            body_content=body_content,
+            body_content_type=body_content_type,
+            location=location,
+            attendees=attendees,
+            calendar_id=calendar_id,
+        )
+        response = graph_request(spec["method"], spec["url"], access_token, json=spec["body"])
         response.raise_for_status()
 
-        event = response.json()
+        # Skip decoding the created event when the caller does not need it
+        if not return_body:
+            print(f"Created event: {subject}")
+            return {"result": {"status_code": response.status_code}, "error": None}
+
+        event = loads_json(response)
         print(f"Created event: {event.get('subject')}")
         return {"result": event, "error": None}
         
@@ -289,13 +364,9 @@ def delete_event(event_id: str) -> Dict[str, Any]:
     """Delete an event"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/events/{event_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/events/{event_id}"
 
-        response = requests.delete(url, headers=headers, timeout=10)
+        response = graph_request("DELETE", path, access_token)
         response.raise_for_status()
 
         print(f"Deleted event: {event_id}")
@@ -305,3 +376,145 @@ def delete_event(event_id: str) -> Dict[str, Any]:
         error_message = f"Error deleting event: {e}"
         print(error_message)
         return {"result": None, "error": error_message}
+
+
+def create_many_calendars(calendars: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create multiple calendars using Graph JSON batching"""
+    try:
+        ops = [
+            _create_calendar_request(calendar["name"], calendar.get("color", "auto"))
+            for calendar in calendars
+        ]
+        results = OutlookBatchClient.submit(ops)
+
+        created = sum(1 for result in results if result["error"] is None)
+        print(f"Created {created} of {len(results)} calendars")
+        return {"result": results, "error": None}
+
+    except Exception as e:
+        error_message = f"Error creating multiple calendars: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def delete_many_calendars(calendar_ids: List[str]) -> Dict[str, Any]:
+    """Delete multiple calendars using Graph JSON batching"""
+    try:
+        ops = [_delete_calendar_request(calendar_id) for calendar_id in calendar_ids]
+        results = OutlookBatchClient.submit(ops)
+
+        deleted = [
+            {
+                "id": calendar_id,
+                "result": "Calendar deleted successfully" if result["error"] is None else None,
+                "error": result["error"],
+            }
+            for calendar_id, result in zip(calendar_ids, results)
+        ]
+
+        deleted_count = sum(1 for item in deleted if item["error"] is None)
+        print(f"Deleted {deleted_count} of {len(deleted)} calendars")
+        return {"result": deleted, "error": None}
+
+    except Exception as e:
+        error_message = f"Error deleting multiple calendars: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def create_many_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create multiple events using Graph JSON batching"""
+    try:
+        ops = [_create_event_request(**event) for event in events]
+        results = OutlookBatchClient.submit(ops)
+
+        created = sum(1 for result in results if result["error"] is None)
+        print(f"Created {created} of {len(results)} events")
+        return {"result": results, "error": None}
+
+    except Exception as e:
+        error_message = f"Error creating multiple events: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def delete_many_events(event_ids: List[str]) -> Dict[str, Any]:
+    """Delete multiple events using Graph JSON batching"""
+    try:
+        ops = [_delete_event_request(event_id) for event_id in event_ids]
+        results = OutlookBatchClient.submit(ops)
+
+        deleted = [
+            {
+                "id": event_id,
+                "result": "Event deleted successfully" if result["error"] is None else None,
+                "error": result["error"],
+            }
+            for event_id, result in zip(event_ids, results)
+        ]
+
+        deleted_count = sum(1 for item in deleted if item["error"] is None)
+        print(f"Deleted {deleted_count} of {len(deleted)} events")
+        return {"result": deleted, "error": None}
+
+    except Exception as e:
+        error_message = f"Error deleting multiple events: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def get_many_events(event_ids: List[str]) -> Dict[str, Any]:
+    """Get details for multiple events using Graph JSON batching"""
+    try:
+        ops = [
+            {"method": "GET", "url": f"/me/events/{event_id}?$select={EVENT_SELECT}"}
+            for event_id in event_ids
+        ]
+        results = OutlookBatchClient.submit(ops)
+
+        events_data = [
+            _filter_event(result["result"] or {}) if result["error"] is None
+            else {"id": event_id, "error": result["error"]}
+            for event_id, result in zip(event_ids, results)
+        ]
+
+        print(f"Retrieved {len(events_data)} event details")
+        return {"result": events_data, "error": None}
+
+    except Exception as e:
+        error_message = f"Error getting multiple events: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def get_events_in_ranges(ranges: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Get events for multiple calendar/time-range queries using Graph JSON batching"""
+    try:
+        ops = [_calendar_view_request(**time_range) for time_range in ranges]
+        results = OutlookBatchClient.submit(ops)
+
+        ranges_data = []
+        for time_range, result in zip(ranges, results):
+            if result["error"] is not None:
+                ranges_data.append({**time_range, "events": None, "error": result["error"]})
+                continue
+
+            page = result["result"] or {}
+            events = page.get("value", [])
+            # Busy ranges spill past the first page; read the rest directly
+            if page.get("@odata.nextLink"):
+                events += graph_get_all(page["@odata.nextLink"], get_access_token())
+
+            ranges_data.append({
+                **time_range,
+                "events": [_filter_event(event) for event in events],
+                "error": None,
+            })
+
+        print(f"Retrieved events for {len(ranges_data)} time ranges")
+        return {"result": ranges_data, "error": None}
+
+    except Exception as e:
+        error_message = f"Error getting events for multiple ranges: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
@@ -1,13 +1,16 @@
 """Contact management tools for Outlook MCP Server"""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import requests
-from ..connection import get_access_token
+from ..batch import OutlookBatchClient
+from ..connection import (
+    LIST_PAGE_SIZE, get_access_token, graph_request, iter_graph_collection, loads_json,
+)
 
 
 class OutlookContactCreator:
     @staticmethod
     def build_contact_payload(
-        given_name: str,
+        given_name: Optional[str],
         surname: Optional[str] = None,
         email_addresses: Optional[str] = None,
         business_phones: Optional[str] = None,
@@ -34,31 +37,58 @@ class OutlookContactCreator:
         Returns:
             Dictionary matching the Microsoft Graph API contact schema
         """
-        payload: Dict[str, Any] = {"givenName": given_name}
+        simple_fields = (
+            ("surname", surname),
+            ("mobilePhone", mobile_phone),
+            ("jobTitle", job_title),
+            ("companyName", company_name),
+            ("department", department),
+            ("officeLocation", office_location),
+        )
+        payload: Dict[str, Any] = {
+            "givenName": given_name,
+            **{key: value for key, value in simple_fields if value},
+        }
 
-        if surname:
-            payload["surname"] = surname
         if email_addresses:
             # Convert comma-separated string to list of email objects
-            email_list = [e.strip() for e in email_addresses.split(",")]
-            payload["emailAddresses"] = [{"address": email} for email in email_list]
+            payload["emailAddresses"] = [
+                {"address": email} for email in map(str.strip, email_addresses.split(","))
+            ]
         if business_phones:
             # Convert comma-separated string to list
-            payload["businessPhones"] = [p.strip() for p in business_phones.split(",")]
-        if mobile_phone:
-            payload["mobilePhone"] = mobile_phone
-        if job_title:
-            payload["jobTitle"] = job_title
-        if company_name:
-            payload["companyName"] = company_name
-        if department:
-            payload["department"] = department
-        if office_location:
-            payload["officeLocation"] = office_location
+            payload["businessPhones"] = list(map(str.strip, business_phones.split(",")))
 
         return payload
 
 
+def _delete_contact_request(contact_id: str) -> Dict[str, Any]:
+    """Build the request spec for deleting a contact"""
+    return {"method": "DELETE", "url": f"/me/contacts/{contact_id}"}
+
+
+# $select list matching the fields kept by _filter_contact
+CONTACT_SELECT = (
+    "id,displayName,givenName,surname,emailAddresses,businessPhones,"
+    "mobilePhone,jobTitle,companyName"
+)
+
+
+def _filter_contact(contact: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Graph contact to the fields returned by the contact tools"""
+    return {
+        "id": contact.get("id"),
+        "displayName": contact.get("displayName"),
+        "givenName": contact.get("givenName"),
+        "surname": contact.get("surname"),
+        "emailAddresses": contact.get("emailAddresses", []),
+        "businessPhones": contact.get("businessPhones", []),
+        "mobilePhone": contact.get("mobilePhone"),
+        "jobTitle": contact.get("jobTitle"),
+        "companyName": contact.get("companyName"),
+    }
+
+
 def create_contact(
     given_name: str,
     surname: str = "",
@@ -69,13 +99,13 @@ def create_contact(
     company_name: str = "",
     department: str = "",
     office_location: str = "",
+    return_body: bool = True,
 ) -> Dict[str, Any]:
     """Create a new contact in Outlook"""
     try:
         access_token = get_access_token()
         
-        contact_creator = OutlookContactCreator()
-        contact_data = contact_creator.build_contact_payload(
+        contact_data = OutlookContactCreator.build_contact_payload(
             given_name=given_name,
             surname=surname,
             email_addresses=email_addresses,
@@ -87,16 +117,17 @@ def create_contact(
             office_location=office_location,
         )
 
-        url = "https://graph.microsoft.com/v1.0/me/contacts"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = "/me/contacts"
 
-        response = requests.post(url, headers=headers, json=contact_data, timeout=10)
+        response = graph_request("POST", path, access_token, json=contact_data)
         response.raise_for_status()
 
-        contact = response.json()
+        # Skip decoding the created contact when the caller does not need it
+        if not return_body:
+            print(f"Created contact: {given_name}")
+            return {"result": {"status_code": response.status_code}, "error": None}
+
+        contact = loads_json(response)
         print(f"Created contact: {contact.get('id')}")
         return {"result": contact, "error": None}
         
@@ -114,30 +145,11 @@ def get_all_contacts() -> Dict[str, Any]:
     """Get all contacts from Outlook"""
     try:
         access_token = get_access_token()
-        url = "https://graph.microsoft.com/v1.0/me/contacts"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = "/me/contacts"
+        params = {"$select": CONTACT_SELECT, "$top": LIST_PAGE_SIZE}
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-
-        contacts = response.json().get("value", [])
-        filtered_contacts = [
-            {
-                "id": contact.get("id"),
-                "displayName": contact.get("displayName"),
-                "givenName": contact.get("givenName"),
-                "surname": contact.get("surname"),
-                "emailAddresses": contact.get("emailAddresses", []),
-                "businessPhones": contact.get("businessPhones", []),
-                "mobilePhone": contact.get("mobilePhone"),
-                "jobTitle": contact.get("jobTitle"),
-                "companyName": contact.get("companyName"),
-            }
-            for contact in contacts
-        ]
+        contacts = iter_graph_collection(path, access_token, params=params)
+        filtered_contacts = [_filter_contact(contact) for contact in contacts]
 
         print(f"Retrieved {len(filtered_contacts)} contacts")
         return {"result": filtered_contacts, "error": None}
@@ -152,16 +164,12 @@ def get_contact_details(contact_id: str) -> Dict[str, Any]:
     """Get details of a specific contact"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/contacts/{contact_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/contacts/{contact_id}"
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = graph_request("GET", path, access_token)
         response.raise_for_status()
 
-        contact = response.json()
+        contact = loads_json(response)
         print(f"Retrieved contact details for: {contact.get('displayName')}")
         return {"result": contact, "error": None}
         
@@ -186,39 +194,27 @@ def update_contact(
     """Update an existing contact"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/contacts/{contact_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/contacts/{contact_id}"
 
-        # Build update payload
-        update_data = {}
-        
-        if given_name:
-            update_data["givenName"] = given_name
-        if surname:
-            update_data["surname"] = surname
-        if email_addresses:
-            email_list = [e.strip() for e in email_addresses.split(",")]
-            update_data["emailAddresses"] = [{"address": email} for email in email_list]
-        if business_phones:
-            update_data["businessPhones"] = [p.strip() for p in business_phones.split(",")]
-        if mobile_phone:
-            update_data["mobilePhone"] = mobile_phone
-        if job_title:
-            update_data["jobTitle"] = job_title
-        if company_name:
-            update_data["companyName"] = company_name
-        if department:
-            update_data["department"] = department
-        if office_location:
-            update_data["officeLocation"] = office_location
-
-        response = requests.patch(url, headers=headers, json=update_data, timeout=10)
+        # Build update payload, sending givenName only when provided
+        update_data = OutlookContactCreator.build_contact_payload(
+            given_name=given_name,
+            surname=surname,
+            email_addresses=email_addresses,
+            business_phones=business_phones,
+            mobile_phone=mobile_phone,
+            job_title=job_title,
+            company_name=company_name,
+            department=department,
+            office_location=office_location,
+        )
+        if not given_name:
+            del update_data["givenName"]
+
+        response = graph_request("PATCH", path, access_token, json=update_data)
         response.raise_for_status()
 
-        updated_contact = response.json()
+        updated_contact = loads_json(response)
         print(f"Updated contact: {contact_id}")
         return {"result": updated_contact, "error": None}
         
@@ -232,13 +228,8 @@ def delete_contact(contact_id: str) -> Dict[str, Any]:
     """Delete a contact"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/contacts/{contact_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.delete(url, headers=headers, timeout=10)
+        spec = _delete_contact_request(contact_id)
+        response = graph_request(spec["method"], spec["url"], access_token)
         response.raise_for_status()
 
         print(f"Deleted contact: {contact_id}")
@@ -248,3 +239,75 @@ def delete_contact(contact_id: str) -> Dict[str, Any]:
         error_message = f"Error deleting contact: {e}"
         print(error_message)
         return {"result": None, "error": error_message}
+
+
+def create_many_contacts(contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Create multiple contacts using Graph JSON batching"""
+    try:
+        ops = [
+            {
+                "method": "POST",
+                "url": "/me/contacts",
+                "body": OutlookContactCreator.build_contact_payload(**contact),
+            }
+            for contact in contacts
+        ]
+        results = OutlookBatchClient.submit(ops)
+
+        created = sum(1 for result in results if result["error"] is None)
+        print(f"Created {created} of {len(results)} contacts")
+        return {"result": results, "error": None}
+
+    except Exception as e:
+        error_message = f"Error creating multiple contacts: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def delete_many_contacts(contact_ids: List[str]) -> Dict[str, Any]:
+    """Delete multiple contacts using Graph JSON batching"""
+    try:
+        ops = [_delete_contact_request(contact_id) for contact_id in contact_ids]
+        results = OutlookBatchClient.submit(ops)
+
+        deleted = [
+            {
+                "id": contact_id,
+                "result": "Contact deleted successfully" if result["error"] is None else None,
+                "error": result["error"],
+            }
+            for contact_id, result in zip(contact_ids, results)
+        ]
+
+        deleted_count = sum(1 for item in deleted if item["error"] is None)
+        print(f"Deleted {deleted_count} of {len(deleted)} contacts")
+        return {"result": deleted, "error": None}
+
+    except Exception as e:
+        error_message = f"Error deleting multiple contacts: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def get_many_contacts(contact_ids: List[str]) -> Dict[str, Any]:
+    """Get details for multiple contacts using Graph JSON batching"""
+    try:
+        ops = [
+            {"method": "GET", "url": f"/me/contacts/{contact_id}?$select={CONTACT_SELECT}"}
+            for contact_id in contact_ids
+        ]
+        results = OutlookBatchClient.submit(ops)
+
+        contacts_data = [
+            _filter_contact(result["result"] or {}) if result["error"] is None
+            else {"id": contact_id, "error": result["error"]}
+            for contact_id, result in zip(contact_ids, results)
+        ]
+
+        print(f"Retrieved {len(contacts_data)} contact details")
+        return {"result": contacts_data, "error": None}
+
+    except Exception as e:
+        error_message = f"Error getting multiple contacts: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
@@ -1,122 +1,285 @@
 """Email management tools for Outlook MCP Server"""
+import base64
+import re
+import time
 from typing import Dict, Any, List, Optional
-import requests
-from ..connection import get_access_token
+from ..batch import OutlookBatchClient
+from ..connection import (
+    LIST_PAGE_SIZE, get_access_token, graph_request, iter_graph_collection, loads_json, logger,
+    upload_in_chunks,
+)
+
+# Graph rejects inline attachments from this size on; larger files need an upload session
+LARGE_ATTACHMENT_SIZE = 3 * 1024 * 1024
+# Upload session chunks must be a multiple of 320 KiB
+UPLOAD_CHUNK_SIZE = 10 * 320 * 1024
+# Seconds allowed per email in send_emails before the remaining direct sends are skipped
+SEND_TIME_BUDGET = 30
+
+
+# Loose shape check only (one @, a dot in the domain); quotes, apostrophes and
+# non-ASCII addresses are left for Graph to judge
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# $select list matching the fields returned by get_draft_emails
+DRAFT_SELECT = "id,subject,bodyPreview,createdDateTime,lastModifiedDateTime,toRecipients"
+
+
+def _delete_draft_request(draft_id: str) -> Dict[str, Any]:
+    """Build the request spec for deleting a draft email"""
+    return {"method": "DELETE", "url": f"/me/messages/{draft_id}"}
+
+
+def _as_recipients(addresses: List[str]) -> List[Dict[str, Any]]:
+    """Build Graph recipient objects from plain email addresses, dropping repeats"""
+    # Addresses compare case-insensitively; keep the first spelling given
+    unique = {}
+    invalid = []
+    for address in addresses:
+        address = (address or "").strip()
+        if _EMAIL_RE.match(address):
+            unique.setdefault(address.lower(), address)
+        else:
+            invalid.append(address)
+
+    # Fail before the request rather than dropping recipients: an empty list would
+    # clear a draft's recipients, and Graph rejects malformed ones anyway
+    if invalid:
+        raise ValueError(f"Invalid recipient email addresses: {', '.join(map(repr, invalid))}")
+
+    return [{"emailAddress": {"address": address}} for address in unique.values()]
+
+
+def _has_valid_recipients(email_data: Dict[str, Any]) -> bool:
+    """Whether an email has a "to" address and every recipient is well-formed"""
+    get = email_data.get
+    addresses = [*(get("to") or ()), *(get("cc") or ()), *(get("bcc") or ())]
+    return bool(get("to")) and all(_EMAIL_RE.match((address or "").strip()) for address in addresses)
+
+
+def _as_file_attachments(attachments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build Graph fileAttachment objects from attachment dicts"""
+    return [
+        {
+            "@odata.type": "#microsoft.graph.fileAttachment",
+            "name": attachment.get("name", ""),
+            "contentType": attachment.get("contentType", ""),
+            "contentBytes": attachment.get("contentBytes", "")
+        } for attachment in attachments
+    ]
+
+
+# Optional email_data keys: (input key, Graph message key, converter or None to copy as-is)
+_OPTIONAL_MESSAGE_FIELDS = (
+    ("cc", "ccRecipients", _as_recipients),
+    ("bcc", "bccRecipients", _as_recipients),
+    ("attachments", "attachments", _as_file_attachments),
+    ("internetMessageHeaders", "internetMessageHeaders", None),
+    ("importance", "importance", None),
+    ("flag", "flag", None),
+)
+
+
+def _decoded_size(content_bytes: str) -> int:
+    """Size in bytes of base64 content without decoding it"""
+    # b64decode skips line breaks and other whitespace, so don't count them
+    content_bytes = "".join(content_bytes.split())
+    return len(content_bytes) * 3 // 4 - content_bytes[-2:].count("=")
+
+
+def _needs_upload_session(email_data: Dict[str, Any]) -> bool:
+    """Whether an email's attachments are too large to send inline"""
+    attachments = email_data.get("attachments") or ()
+    total = sum(_decoded_size(attachment.get("contentBytes", "")) for attachment in attachments)
+    return total >= LARGE_ATTACHMENT_SIZE
 
 
 class OutlookEmailSender:
     @staticmethod
     def prepare_message(email_data: Dict[str, Any]) -> Dict[str, Any]:
         """Helper method to prepare a single message payload"""
+        get = email_data.get
         message = {
-            "subject": email_data.get("subject", ""),
+            "subject": get("subject", ""),
             "body": {
-                "contentType": email_data.get("contentType", "HTML"),
-                "content": email_data.get("content", "")
+                "contentType": get("contentType", "HTML"),
+                "content": get("content", "")
             },
-            "toRecipients": [
-                {
-                    "emailAddress": {
-                        "address": recipient
-                    }
-                } for recipient in email_data.get("to", [])
-            ]
+            "toRecipients": _as_recipients(get("to", []))
         }
-        
-        # Add CC recipients if provided
-        if "cc" in email_data:
-            message["ccRecipients"] = [
-                {
-                    "emailAddress": {
-                        "address": recipient
-                    }
-                } for recipient in email_data["cc"]
-            ]
-        
-        # Add BCC recipients if provided
-        if "bcc" in email_data:
-            message["bccRecipients"] = [
-                {
-                    "emailAddress": {
-                        "address": recipient
-                    }
-                } for recipient in email_data["bcc"]
-            ]
-        
-        # Add attachments if provided
-        if "attachments" in email_data:
-            message["attachments"] = [
-                {
-                    "@odata.type": "#microsoft.graph.fileAttachment",
-                    "name": attachment.get("name", ""),
-                    "contentType": attachment.get("contentType", ""),
-                    "contentBytes": attachment.get("contentBytes", "")
-                } for attachment in email_data["attachments"]
-            ]
-
-        # Add custom headers if provided
-        if "internetMessageHeaders" in email_data:
-            message["internetMessageHeaders"] = email_data["internetMessageHeaders"]
+        # Fail locally rather than paying a round-trip for Graph's 400
+        if not message["toRecipients"]:
+            raise ValueError("At least one recipient email address is required")
 
-        # Add importance if provided
-        if "importance" in email_data:
-            message["importance"] = email_data["importance"]
+        # Add optional fields if provided; empty values are left out
+        for key, message_key, convert in _OPTIONAL_MESSAGE_FIELDS:
+            value = get(key)
+            if value:
+                message[message_key] = convert(value) if convert else value
 
-        # Add flag if provided
-        if "flag" in email_data:
-            message["flag"] = email_data["flag"]
-            
         return message
 
+    @staticmethod
+    def build_send_request(email_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Helper method to build the sendMail request spec for one email"""
+        return {
+            "method": "POST",
+            "url": "/me/sendMail",
+            "body": {
+                "message": OutlookEmailSender.prepare_message(email_data),
+                "saveToSentItems": email_data.get("saveToSentItems", True)
+            }
+        }
+
+    @staticmethod
+    def add_attachment(message_id: str, attachment: Dict[str, Any], access_token: str) -> None:
+        """Helper method to attach a file to a draft, via an upload session when large"""
+        # Decode once: the upload session's declared size must match the bytes sent
+        content = base64.b64decode(attachment.get("contentBytes", ""))
+        size = len(content)
+
+        if size < LARGE_ATTACHMENT_SIZE:
+            path = f"/me/messages/{message_id}/attachments"
+            response = graph_request(
+                "POST", path, access_token, json=_as_file_attachments([attachment])[0]
+            )
+            response.raise_for_status()
+            return
+
+        path = f"/me/messages/{message_id}/attachments/createUploadSession"
+        session_request = {
+            "AttachmentItem": {
+                "attachmentType": "file",
+                "name": attachment.get("name", ""),
+                "size": size,
+                "contentType": attachment.get("contentType") or "application/octet-stream",
+            }
+        }
+        response = graph_request("POST", path, access_token, json=session_request)
+        response.raise_for_status()
+
+        upload_url = loads_json(response)["uploadUrl"]
+        upload_in_chunks(upload_url, content, UPLOAD_CHUNK_SIZE)
+
+    @staticmethod
+    def send_with_upload_sessions(email_data: Dict[str, Any], access_token: str) -> None:
+        """
+        Helper method to send an email whose attachments exceed the inline limit.
+
+        The message is created as a draft, attachments are added one by one
+        (large ones through upload sessions) and the draft is then sent.
+        Sent drafts are always saved to Sent Items, so not saving is rejected.
+        """
+        if not email_data.get("saveToSentItems", True):
+            raise ValueError(
+                "saveToSentItems=False is not supported when attachments total 3 MB or more"
+            )
+
+        message = OutlookEmailSender.prepare_message({**email_data, "attachments": None})
+        response = graph_request("POST", "/me/messages", access_token, json=message)
+        response.raise_for_status()
+        message_id = loads_json(response)["id"]
+
+        try:
+            for attachment in email_data["attachments"]:
+                OutlookEmailSender.add_attachment(message_id, attachment, access_token)
+
+            response = graph_request("POST", f"/me/messages/{message_id}/send", access_token)
+            response.raise_for_status()
+        except Exception:
+            # Don't leave a half-built draft behind, but keep the original error
+            try:
+                graph_request("DELETE", f"/me/messages/{message_id}", access_token)
+            except Exception as cleanup_error:
+                logger.warning("Error deleting unsent draft %s: %s", message_id, cleanup_error)
+            raise
+
+    @staticmethod
+    def send_one(email_data: Dict[str, Any], access_token: str) -> Dict[str, Any]:
+        """Helper method to send a single email and report its status"""
+        try:
+            if _needs_upload_session(email_data):
+                OutlookEmailSender.send_with_upload_sessions(email_data, access_token)
+            else:
+                spec = OutlookEmailSender.build_send_request(email_data)
+                response = graph_request(
+                    spec["method"], spec["url"], access_token, json=spec["body"]
+                )
+                response.raise_for_status()
+
+            # Any non-2xx response has raised by now
+            print(f"Email sent successfully to {', '.join(email_data.get('to', []))}")
+            return {
+                "status": "success",
+                "recipients": email_data.get("to", []),
+                "error": None
+            }
+                
+        except Exception as e:
+            print(f"Error sending individual email: {e}")
+            return {
+                "status": "failed",
+                "recipients": email_data.get("to", []),
+                "error": str(e)
+            }
+
+    @staticmethod
+    def send_before_deadline(email_data: Dict[str, Any], access_token: str, deadline: float) -> Dict[str, Any]:
+        """Helper method to send a single email unless the overall deadline has passed"""
+        if time.monotonic() > deadline:
+            return {
+                "status": "failed",
+                "recipients": email_data.get("to", []),
+                "error": "Skipped: send deadline exceeded"
+            }
+        return OutlookEmailSender.send_one(email_data, access_token)
+
     @staticmethod
     def send_emails(emails_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Send multiple emails"""
+        """Send multiple emails, packing them into Graph $batch requests"""
         try:
             access_token = get_access_token()
-            url = "https://graph.microsoft.com/v1.0/me/sendMail"
-            headers = {
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            }
-            
+
+            # A lone email skips the $batch envelope and keeps graph_request's retries
+            if len(emails_data) <= 1:
+                results = [
+                    OutlookEmailSender.send_one(email_data, access_token)
+                    for email_data in emails_data
+                ]
+                return {"result": results, "error": None}
+
+            # One slow upload or resend must not stall the rest indefinitely
+            deadline = time.monotonic() + SEND_TIME_BUDGET * len(emails_data)
+
+            # Emails with large attachments need several requests each, so send them on their own
+            batched = [
+                email_data for email_data in emails_data
+                if _has_valid_recipients(email_data) and not _needs_upload_session(email_data)
+            ]
+            ops = [OutlookEmailSender.build_send_request(email_data) for email_data in batched]
+            batch_results = iter(OutlookBatchClient.submit(ops))
+
             results = []
             for email_data in emails_data:
-                try:
-                    # Prepare the message payload
-                    message = OutlookEmailSender.prepare_message(email_data)
-                    payload = {
-                        "message": message,
-                        "saveToSentItems": email_data.get("saveToSentItems", True)
-                    }
-
-                    # Send the email
-                    response = requests.post(
-                        url, headers=headers, json=payload, timeout=10
+                if not _has_valid_recipients(email_data):
+                    # Rejected in prepare_message before any request is made
+                    results.append(OutlookEmailSender.send_one(email_data, access_token))
+                    continue
+
+                if _needs_upload_session(email_data):
+                    results.append(
+                        OutlookEmailSender.send_before_deadline(email_data, access_token, deadline)
                     )
-                    response.raise_for_status()
-                    
-                    # Track the result
-                    if response.status_code == 202:
-                        print(f"Email sent successfully to {', '.join(email_data.get('to', []))}")
-                        results.append({
-                            "status": "success",
-                            "recipients": email_data.get("to", []),
-                            "error": None
-                        })
-                    else:
-                        results.append({
-                            "status": "failed",
-                            "recipients": email_data.get("to", []),
-                            "error": f"Unexpected status code: {response.status_code}"
-                        })
-                        
-                except Exception as e:
-                    print(f"Error sending individual email: {e}")
-                    results.append({
-                        "status": "failed",
-                        "recipients": email_data.get("to", []),
-                        "error": str(e)
-                    })
+                    continue
+
+                error = next(batch_results)["error"]
+                if error is None:
+                    print(f"Email sent successfully to {', '.join(email_data.get('to', []))}")
+                results.append({
+                    "status": "success" if error is None else "failed",
+                    "recipients": email_data.get("to", []),
+                    "error": error
+                })
             
             return {"result": results, "error": None}
             
@@ -126,7 +289,7 @@ class OutlookEmailSender:
             return {"result": None, "error": error_message}
 
 
-def send_email(
+def _email_data(
     subject: str,
     content: str,
     to_recipients: List[str],
@@ -139,25 +302,7 @@ def send_email(
     custom_headers: Optional[List[Dict[str, str]]] = None,
     flag: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    """
-    Send email via Outlook with all available options
-    
-    Args:
-        subject: Email subject
-        content: Email body content
-        to_recipients: List of email addresses for TO field
-        cc_recipients: Optional list of CC recipients
-        bcc_recipients: Optional list of BCC recipients
-        content_type: Type of content - HTML or Text
-        save_to_sent: Whether to save in Sent Items folder
-        importance: Email importance level (low, normal, high)
-        attachments: Optional list of attachments
-        custom_headers: Optional list of custom email headers
-        flag: Optional flag settings for the email
-        
-    Returns:
-        Dict containing the result of the email sending operation
-    """
+    """Build the sender's email dict from send_email-style arguments"""
     # Construct the email data
     email_data = {
         "subject": subject,
@@ -191,15 +336,72 @@ def send_email(
     if flag:
         email_data["flag"] = flag
 
+    return email_data
+
+
+def send_email(
+    subject: str,
+    content: str,
+    to_recipients: List[str],
+    cc_recipients: Optional[List[str]] = None,
+    bcc_recipients: Optional[List[str]] = None,
+    content_type: str = "HTML",
+    save_to_sent: bool = True,
+    importance: Optional[str] = None,
+    attachments: Optional[List[Dict[str, Any]]] = None,
+    custom_headers: Optional[List[Dict[str, str]]] = None,
+    flag: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Send email via Outlook with all available options
+    
+    Args:
+        subject: Email subject
+        content: Email body content
+        to_recipients: List of email addresses for TO field
+        cc_recipients: Optional list of CC recipients
+        bcc_recipients: Optional list of BCC recipients
+        content_type: Type of content - HTML or Text
+        save_to_sent: Whether to save in Sent Items folder
+        importance: Email importance level (low, normal, high)
+        attachments: Optional list of attachments
+        custom_headers: Optional list of custom email headers
+        flag: Optional flag settings for the email
+        
+    Returns:
+        Dict containing the result of the email sending operation
+    """
+    email_data = _email_data(
+        subject, content, to_recipients, cc_recipients, bcc_recipients, content_type,
+        save_to_sent, importance, attachments, custom_headers, flag
+    )
+
     try:
-        email_sender = OutlookEmailSender()
-        return email_sender.send_emails(emails_data=[email_data])
+        return OutlookEmailSender.send_emails(emails_data=[email_data])
     except Exception as e:
         error_message = f"Error in email sending: {e}"
         print(error_message)
         return {"result": None, "error": error_message}
 
 
+def send_many_emails(emails: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Send several emails, packing them into Graph $batch requests
+
+    Args:
+        emails: Emails to send, each with the same fields as send_email's arguments
+
+    Returns:
+        Dict with one {"status", "recipients", "error"} entry per email, in the order given
+    """
+    try:
+        return OutlookEmailSender.send_emails([_email_data(**email) for email in emails])
+    except Exception as e:
+        error_message = f"Error in batch email sending: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
 def create_draft_email(
     subject: str,
     content: str,
@@ -213,11 +415,7 @@ def create_draft_email(
     """Create a draft email"""
     try:
         access_token = get_access_token()
-        url = "https://graph.microsoft.com/v1.0/me/messages"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = "/me/messages"
         
         # Prepare the message payload
         message = {
@@ -226,24 +424,15 @@ def create_draft_email(
                 "contentType": content_type,
                 "content": content
             },
-            "toRecipients": [
-                {"emailAddress": {"address": recipient}}
-                for recipient in to_recipients
-            ]
+            "toRecipients": _as_recipients(to_recipients)
         }
         
         # Add optional fields
         if cc_recipients:
-            message["ccRecipients"] = [
-                {"emailAddress": {"address": recipient}}
-                for recipient in cc_recipients
-            ]
+            message["ccRecipients"] = _as_recipients(cc_recipients)
         
         if bcc_recipients:
-            message["bccRecipients"] = [
-                {"emailAddress": {"address": recipient}}
-                for recipient in bcc_recipients
-            ]
+            message["bccRecipients"] = _as_recipients(bcc_recipients)
             
         if importance:
             message["importance"] = importance
@@ -251,10 +440,10 @@ def create_draft_email(
         if attachments:
             message["attachments"] = attachments
 
-        response = requests.post(url, headers=headers, json=message, timeout=10)
+        response = graph_request("POST", path, access_token, json=message)
         response.raise_for_status()
         
-        draft = response.json()
+        draft = loads_json(response)
         print(f"Draft created successfully with ID: {draft.get('id')}")
         return {"result": draft, "error": None}
         
@@ -268,13 +457,9 @@ def send_draft_email(draft_id: str) -> Dict[str, Any]:
     """Send a draft email"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/messages/{draft_id}/send"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/messages/{draft_id}/send"
 
-        response = requests.post(url, headers=headers, timeout=10)
+        response = graph_request("POST", path, access_token)
         response.raise_for_status()
         
         print(f"Draft {draft_id} sent successfully")
@@ -290,16 +475,10 @@ def get_draft_emails() -> Dict[str, Any]:
     """Get all draft emails"""
     try:
         access_token = get_access_token()
-        url = "https://graph.microsoft.com/v1.0/me/mailFolders/drafts/messages"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = "/me/mailFolders/drafts/messages"
+        params = {"$select": DRAFT_SELECT, "$top": LIST_PAGE_SIZE}
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        drafts = response.json().get("value", [])
+        drafts = iter_graph_collection(path, access_token, params=params)
         filtered_drafts = [
             {
                 "id": draft.get("id"),
@@ -328,13 +507,8 @@ def delete_draft_email(draft_id: str) -> Dict[str, Any]:
     """Delete a draft email"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/messages/{draft_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
-        response = requests.delete(url, headers=headers, timeout=10)
+        spec = _delete_draft_request(draft_id)
+        response = graph_request(spec["method"], spec["url"], access_token)
         response.raise_for_status()
         
         print(f"Draft {draft_id} deleted successfully")
@@ -346,6 +520,31 @@ def delete_draft_email(draft_id: str) -> Dict[str, Any]:
         return {"result": None, "error": error_message}
 
 
+def delete_many_draft_emails(draft_ids: List[str]) -> Dict[str, Any]:
+    """Delete multiple draft emails using Graph JSON batching"""
+    try:
+        ops = [_delete_draft_request(draft_id) for draft_id in draft_ids]
+        results = OutlookBatchClient.submit(ops)
+
+        deleted = [
+            {
+                "id": draft_id,
+                "result": "Draft deleted successfully" if result["error"] is None else None,
+                "error": result["error"],
+            }
+            for draft_id, result in zip(draft_ids, results)
+        ]
+
+        deleted_count = sum(1 for item in deleted if item["error"] is None)
+        print(f"Deleted {deleted_count} of {len(deleted)} drafts")
+        return {"result": deleted, "error": None}
+
+    except Exception as e:
+        error_message = f"Error deleting multiple drafts: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
 def update_draft_email(
     draft_id: str,
     subject: Optional[str] = None,
@@ -359,11 +558,7 @@ def update_draft_email(
     """Update a draft email"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/messages/{draft_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/messages/{draft_id}"
         
         # Build update payload
         update_data = {}
@@ -378,30 +573,21 @@ def update_draft_email(
             }
             
         if to_recipients:
-            update_data["toRecipients"] = [
-                {"emailAddress": {"address": recipient}}
-                for recipient in to_recipients
-            ]
+            update_data["toRecipients"] = _as_recipients(to_recipients)
             
         if cc_recipients:
-            update_data["ccRecipients"] = [
-                {"emailAddress": {"address": recipient}}
-                for recipient in cc_recipients
-            ]
+            update_data["ccRecipients"] = _as_recipients(cc_recipients)
             
         if bcc_recipients:
-            update_data["bccRecipients"] = [
-                {"emailAddress": {"address": recipient}}
-                for recipient in bcc_recipients
-            ]
+            update_data["bccRecipients"] = _as_recipients(bcc_recipients)
             
         if importance:
             update_data["importance"] = importance
 
-        response = requests.patch(url, headers=headers, json=update_data, timeout=10)
+        response = graph_request("PATCH", path, access_token, json=update_data)
         response.raise_for_status()
         
-        updated_draft = response.json()
+        updated_draft = loads_json(response)
         print(f"Draft {draft_id} updated successfully")
         return {"result": updated_draft, "error": None}
         
@@ -1,36 +1,116 @@
 """Folder management tools for Outlook MCP Server"""
-from typing import Dict, Any, Optional, List
-import requests
-from ..connection import get_access_token
+from typing import Dict, Any, Optional, List, Tuple
+from ..batch import OutlookBatchClient
+from ..connection import LIST_PAGE_SIZE, get_access_token, graph_get_all, graph_request, loads_json
 
 
-def get_all_folders() -> Dict[str, Any]:
-    """Get all mail folders"""
-    try:
-        access_token = get_access_token()
-        url = "https://graph.microsoft.com/v1.0/me/mailFolders"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+def _create_folder_request(
+    display_name: str,
+    parent_folder_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the request spec for creating a mail folder"""
+    if parent_folder_id:
+        url = f"/me/mailFolders/{parent_folder_id}/childFolders"
+    else:
+        url = "/me/mailFolders"
 
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+    return {"method": "POST", "url": url, "body": {"displayName": display_name}}
 
-        folders = response.json().get("value", [])
-        filtered_folders = [
-            {
-                "id": folder.get("id"),
-                "displayName": folder.get("displayName"),
-                "parentFolderId": folder.get("parentFolderId"),
-                "childFolderCount": folder.get("childFolderCount"),
-                "unreadItemCount": folder.get("unreadItemCount"),
-                "totalItemCount": folder.get("totalItemCount"),
-            }
-            for folder in folders
+
+def _delete_folder_request(folder_id: str) -> Dict[str, Any]:
+    """Build the request spec for deleting a mail folder"""
+    return {"method": "DELETE", "url": f"/me/mailFolders/{folder_id}"}
+
+
+# $select list matching the fields kept by _filter_folder
+FOLDER_SELECT = "id,displayName,parentFolderId,childFolderCount,unreadItemCount,totalItemCount"
+
+
+def _filter_folder(folder: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Graph mail folder to the fields returned by the folder tools"""
+    return {
+        "id": folder.get("id"),
+        "displayName": folder.get("displayName"),
+        "parentFolderId": folder.get("parentFolderId"),
+        "childFolderCount": folder.get("childFolderCount"),
+        "unreadItemCount": folder.get("unreadItemCount"),
+        "totalItemCount": folder.get("totalItemCount"),
+    }
+
+
+# Query options appended to every childFolders sub-request, built once
+_CHILD_FOLDERS_QUERY = f"?$select={FOLDER_SELECT}&$top={LIST_PAGE_SIZE}"
+
+
+def _get_child_folders(
+    parents: List[Dict[str, Any]],
+    access_token: str,
+    max_depth: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Fetch descendants of the given folders, one $batch round per tree level.
+
+    Returns the descendants and an {"id", "error"} entry for each parent
+    whose child folders could not be read.
+    """
+    descendants = []
+    failures = []
+    frontier = [folder for folder in parents if folder.get("childFolderCount")]
+    depth = 0
+
+    while frontier and (max_depth is None or depth < max_depth):
+        depth += 1
+        ops = [
+            {"method": "GET", "url": f"/me/mailFolders/{folder['id']}/childFolders{_CHILD_FOLDERS_QUERY}"}
+            for folder in frontier
         ]
 
-        print(f"Retrieved {len(filtered_folders)} folders")
+        children = []
+        for parent, op, result in zip(frontier, ops, OutlookBatchClient.submit(ops)):
+            if result["error"] is not None:
+                # Sub-requests get no throttling retries, so give a failed one
+                # a direct request, which does
+                try:
+                    children.extend(graph_get_all(op["url"], access_token))
+                except Exception as e:
+                    print(f"Error getting child folders of {parent['id']}: {e}")
+                    failures.append({"id": parent["id"], "error": f"Error getting child folders: {e}"})
+                continue
+
+            page = result["result"] or {}
+            children.extend(page.get("value", []))
+            if page.get("@odata.nextLink"):
+                children.extend(graph_get_all(page["@odata.nextLink"], access_token))
+
+        descendants.extend(children)
+        frontier = [folder for folder in children if folder.get("childFolderCount")]
+
+    return descendants, failures
+
+
+def get_all_folders(
+    include_child_folders: bool = False,
+    max_depth: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get all mail folders, optionally including nested child folders.
+
+    Parents whose child folders could not be read are listed after the
+    folders as {"id", "error"} entries, like get_many_folders' failures.
+    """
+    try:
+        access_token = get_access_token()
+        path = "/me/mailFolders"
+        params = {"$select": FOLDER_SELECT, "$top": LIST_PAGE_SIZE}
+
+        folders = graph_get_all(path, access_token, params=params)
+        failures = []
+        if include_child_folders:
+            descendants, failures = _get_child_folders(folders, access_token, max_depth)
+            folders.extend(descendants)
+        filtered_folders = [_filter_folder(folder) for folder in folders] + failures
+
+        print(f"Retrieved {len(folders)} folders ({len(failures)} child folder lookups failed)")
         return {"result": filtered_folders, "error": None}
         
     except Exception as e:
@@ -43,16 +123,12 @@ def get_folder_details(folder_id: str) -> Dict[str, Any]:
     """Get details of a specific folder"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/mailFolders/{folder_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/mailFolders/{folder_id}"
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = graph_request("GET", path, access_token)
         response.raise_for_status()
 
-        folder = response.json()
+        folder = loads_json(response)
         print(f"Retrieved folder details for: {folder.get('displayName')}")
         return {"result": folder, "error": None}
         
@@ -64,30 +140,22 @@ def get_folder_details(folder_id: str) -> Dict[str, Any]:
 
 def create_folder(
     display_name: str,
-    parent_folder_id: Optional[str] = None
+    parent_folder_id: Optional[str] = None,
+    return_body: bool = True
 ) -> Dict[str, Any]:
     """Create a new mail folder"""
     try:
         access_token = get_access_token()
-        
-        if parent_folder_id:
-            url = f"https://graph.microsoft.com/v1.0/me/mailFolders/{parent_folder_id}/childFolders"
-        else:
-            url = "https://graph.microsoft.com/v1.0/me/mailFolders"
-            
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
-
-        folder_data = {
-            "displayName": display_name
-        }
-
-        response = requests.post(url, headers=headers, json=folder_data, timeout=10)
+        spec = _create_folder_request(display_name, parent_folder_id)
+        response = graph_request(spec["method"], spec["url"], access_token, json=spec["body"])
         response.raise_for_status()
 
-        folder = response.json()
+        # Skip decoding the created folder when the caller does not need it
+        if not return_body:
+            print(f"Created folder: {display_name}")
+            return {"result": {"status_code": response.status_code}, "error": None}
+
+        folder = loads_json(response)
         print(f"Created folder: {folder.get('displayName')}")
         return {"result": folder, "error": None}
         
@@ -104,20 +172,16 @@ def update_folder(
     """Update a folder's display name"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/mailFolders/{folder_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/mailFolders/{folder_id}"
 
         update_data = {
             "displayName": display_name
         }
 
-        response = requests.patch(url, headers=headers, json=update_data, timeout=10)
+        response = graph_request("PATCH", path, access_token, json=update_data)
         response.raise_for_status()
 
-        updated_folder = response.json()
+        updated_folder = loads_json(response)
         print(f"Updated folder: {folder_id}")
         return {"result": updated_folder, "error": None}
         
@@ -131,13 +195,9 @@ def delete_folder(folder_id: str) -> Dict[str, Any]:
     """Delete a mail folder"""
     try:
         access_token = get_access_token()
-        url = f"https://graph.microsoft.com/v1.0/me/mailFolders/{folder_id}"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        path = f"/me/mailFolders/{folder_id}"
 
-        response = requests.delete(url, headers=headers, timeout=10)
+        response = graph_request("DELETE", path, access_token)
         response.raise_for_status()
 
         print(f"Deleted folder: {folder_id}")
@@ -152,36 +212,19 @@ def delete_folder(folder_id: str) -> Dict[str, Any]:
 def get_many_folders(
     folder_ids: List[str]
 ) -> Dict[str, Any]:
-    """Get details for multiple folders"""
+    """Get details for multiple folders using Graph JSON batching"""
     try:
-        access_token = get_access_token()
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        ops = [
+            {"method": "GET", "url": f"/me/mailFolders/{folder_id}?$select={FOLDER_SELECT}"}
+            for folder_id in folder_ids
+        ]
+        results = OutlookBatchClient.submit(ops)
 
-        folders_data = []
-        for folder_id in folder_ids:
-            try:
-                url = f"https://graph.microsoft.com/v1.0/me/mailFolders/{folder_id}"
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
-                
-                folder = response.json()
-                folders_data.append({
-                    "id": folder.get("id"),
-                    "displayName": folder.get("displayName"),
-                    "parentFolderId": folder.get("parentFolderId"),
-                    "childFolderCount": folder.get("childFolderCount"),
-                    "unreadItemCount": folder.get("unreadItemCount"),
-                    "totalItemCount": folder.get("totalItemCount"),
-                })
-            except Exception as e:
-                print(f"Error getting folder {folder_id}: {e}")
-                folders_data.append({
-                    "id": folder_id,
-                    "error": str(e)
-                })
+        folders_data = [
+            _filter_folder(result["result"] or {}) if result["error"] is None
+            else {"id": folder_id, "error": result["error"]}
+            for folder_id, result in zip(folder_ids, results)
+        ]
 
         print(f"Retrieved {len(folders_data)} folder details")
         return {"result": folders_data, "error": None}
@@ -190,3 +233,50 @@ def get_many_folders(
         error_message = f"Error getting multiple folders: {e}"
         print(error_message)
         return {"result": None, "error": error_message}
+
+
+def create_many_folders(
+    display_names: List[str],
+    parent_folder_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Create multiple mail folders using Graph JSON batching"""
+    try:
+        ops = [
+            _create_folder_request(display_name, parent_folder_id)
+            for display_name in display_names
+        ]
+        results = OutlookBatchClient.submit(ops)
+
+        created = sum(1 for result in results if result["error"] is None)
+        print(f"Created {created} of {len(results)} folders")
+        return {"result": results, "error": None}
+
+    except Exception as e:
+        error_message = f"Error creating multiple folders: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
+
+
+def delete_many_folders(folder_ids: List[str]) -> Dict[str, Any]:
+    """Delete multiple mail folders using Graph JSON batching"""
+    try:
+        ops = [_delete_folder_request(folder_id) for folder_id in folder_ids]
+        results = OutlookBatchClient.submit(ops)
+
+        deleted = [
+            {
+                "id": folder_id,
+                "result": "Folder deleted successfully" if result["error"] is None else None,
+                "error": result["error"],
+            }
+            for folder_id, result in zip(folder_ids, results)
+        ]
+
+        deleted_count = sum(1 for item in deleted if item["error"] is None)
+        print(f"Deleted {deleted_count} of {len(deleted)} folders")
+        return {"result": deleted, "error": None}
+
+    except Exception as e:
+        error_message = f"Error deleting multiple folders: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
@@ -0,0 +1,42 @@
+"""Raw Microsoft Graph batching tool for Outlook MCP Server"""
+from typing import Dict, Any, List
+from ..batch import OutlookBatchClient
+
+
+def batch_graph(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run several Microsoft Graph requests through $batch.
+
+    Args:
+        requests: Request specs with "id", "method", "url" (relative to
+            /v1.0, e.g. "/me/contacts/{id}") and an optional JSON "body"
+
+    Returns:
+        One {"id", "result", "error"} dict per request, in the order given
+    """
+    try:
+        ops = []
+        for request in requests:
+            url = request.get("url", "")
+            if not url.startswith("/"):
+                raise ValueError(f"Request URL must be relative to /v1.0: {url}")
+            ops.append({
+                "method": request.get("method", "GET").upper(),
+                "url": url,
+                "body": request.get("body"),
+            })
+
+        results = OutlookBatchClient.submit(ops)
+
+        responses = [
+            {"id": request.get("id", str(index)), **result}
+            for index, (request, result) in enumerate(zip(requests, results))
+        ]
+        failed = sum(1 for result in results if result["error"] is not None)
+        print(f"Ran {len(responses)} Graph requests ({failed} failed)")
+        return {"result": responses, "error": None}
+
+    except Exception as e:
+        error_message = f"Error running batched Graph requests: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}
@@ -0,0 +1,53 @@
+"""Mailbox overview tool for Outlook MCP Server"""
+from typing import Dict, Any
+from ..batch import OutlookBatchClient
+from ..connection import LIST_PAGE_SIZE, get_access_token, graph_get_all
+from .calendar import CALENDAR_SELECT, EVENT_SELECT, _filter_calendar, _filter_event
+from .contacts import CONTACT_SELECT, _filter_contact
+from .folders import FOLDER_SELECT, _filter_folder
+
+# Collection name -> (Graph path, $select list, per-item filter) for the overview batch
+_OVERVIEW_COLLECTIONS = {
+    "calendars": ("/me/calendars", CALENDAR_SELECT, _filter_calendar),
+    "contacts": ("/me/contacts", CONTACT_SELECT, _filter_contact),
+    "events": ("/me/events", EVENT_SELECT, _filter_event),
+    "folders": ("/me/mailFolders", FOLDER_SELECT, _filter_folder),
+}
+
+
+def get_outlook_overview() -> Dict[str, Any]:
+    """Get calendars, contacts, events, and mail folders in one batched call"""
+    try:
+        ops = [
+            {"method": "GET", "url": f"{path}?$select={select}&$top={LIST_PAGE_SIZE}"}
+            for path, select, _ in _OVERVIEW_COLLECTIONS.values()
+        ]
+        results = OutlookBatchClient.submit(ops)
+
+        overview = {}
+        for (name, (_, _, filter_item)), result in zip(_OVERVIEW_COLLECTIONS.items(), results):
+            if result["error"] is not None:
+                overview[name] = {"result": None, "error": result["error"]}
+                continue
+
+            page = result["result"] or {}
+            items = page.get("value", [])
+            # Large collections spill past the first page; read the rest directly
+            if page.get("@odata.nextLink"):
+                items += graph_get_all(page["@odata.nextLink"], get_access_token())
+            overview[name] = {"result": [filter_item(item) for item in items], "error": None}
+
+        print(
+            "Retrieved overview: "
+            + ", ".join(
+                f"{len(section['result'])} {name}"
+                for name, section in overview.items()
+                if section["error"] is None
+            )
+        )
+        return {"result": overview, "error": None}
+
+    except Exception as e:
+        error_message = f"Error getting Outlook overview: {e}"
+        print(error_message)
+        return {"result": None, "error": error_message}